@@ -5,9 +5,32 @@ __email__ = 'ken@bellock.net'
 
 from .alphashape import alphashape
 from .alphashape import circumradius
+from .alphashape import circumradii
 from .alphashape import circumcenter
 from .alphashape import alphasimplices
+from .alphashape import boundary_facets
+from .alphashape import boundary_mesh
+from .alphacomplex import AlphaComplex
 from .optimizealpha import optimizealpha
+from .batch import alphashape_many
+from .sweep import alphashape_sweep
+from .incremental import IncrementalAlphaComplex, SlidingAlphaComplex
+from .adaptive import vectorized_alpha, KNNAlpha
+from .stats import Stats
+from .cache import ComplexCache
 from ._version import __version__  # noqa: F401
-__all__ = ['alphashape', 'optimizealpha', 'circumradius',
-           'circumcenter', 'alphasimplices']
+__all__ = ['alphashape', 'optimizealpha', 'circumradius', 'circumradii',
+           'circumcenter', 'alphasimplices', 'boundary_facets',
+           'boundary_mesh', 'AlphaComplex', 'IncrementalAlphaComplex',
+           'SlidingAlphaComplex', 'alphashape_many', 'alphashape_sweep',
+           'vectorized_alpha', 'KNNAlpha', 'Stats', 'ComplexCache',
+           'AlphashapeExecutor', 'async_alphashape', 'async_optimizealpha']
+
+
+def __getattr__(name):
+    # The executor pulls in asyncio, so it is only imported on first use
+    if name in ('AlphashapeExecutor', 'async_alphashape',
+                'async_optimizealpha'):
+        from . import executor
+        return getattr(executor, name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
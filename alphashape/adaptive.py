@@ -0,0 +1,67 @@
+"""
+Spatially varying alpha parameters.
+
+A callable alpha parameter is normally called once per simplex with the
+vertex indices and the circumradius of that simplex.  Callables marked as
+vectorized, with ``vectorized_alpha`` or a true ``vectorized`` attribute, are
+instead called once with the `S`x(`K`+1) array of all the simplices and the
+length `S` array of their circumradii, and return a length `S` array of
+alpha values.
+"""
+__all__ = ['vectorized_alpha', 'KNNAlpha']
+
+import numpy as np
+from scipy.spatial import cKDTree
+from typing import Union, Tuple, List, Callable
+from .alphashape import _coordinates
+
+
+def vectorized_alpha(function: Callable) -> Callable:
+    """
+    Mark an alpha function as taking arrays of simplices and circumradii.
+
+    Args:
+      function: a function of an `S`x(`K`+1) array of simplices and a
+        length `S` array of circumradii, returning a length `S` array of
+        alpha values
+
+    Returns:
+      The same function, marked as vectorized.
+    """
+    function.vectorized = True
+    return function
+
+
+class KNNAlpha:
+    """
+    A density adaptive alpha parameter.
+
+    The local point spacing at every point is the mean distance to its `k`
+    nearest neighbors.  A simplex passes the radius filter when its
+    circumradius is below `scale` times the mean spacing at its vertices, so
+    sparse regions are wrapped as tightly, relative to their spacing, as
+    dense ones.
+
+    Args:
+      points: the points the alpha shape is computed for
+      k (int): number of nearest neighbors
+      scale (float): the largest accepted circumradius, in units of the
+        local point spacing
+
+    Attributes:
+      spacing: A length `N` array of the local point spacing.
+    """
+    vectorized = True
+
+    def __init__(self, points: Union[List[Tuple[float]], np.ndarray],
+                 k: int = 8, scale: float = 2.):
+        coords = _coordinates(points)
+        k = min(k, len(coords) - 1)
+        distances, _ = cKDTree(coords).query(coords, k=k + 1)
+        self.spacing = distances[:, 1:].mean(axis=1)
+        self.scale = scale
+
+    def __call__(self, simplices: np.ndarray,
+                 radii: np.ndarray) -> np.ndarray:
+        with np.errstate(divide='ignore'):
+            return 1.0 / (self.scale * self.spacing[simplices].mean(axis=1))
@@ -0,0 +1,291 @@
+"""
+A reusable alpha complex for evaluating many alpha values on one point set.
+"""
+__all__ = ['AlphaComplex']
+
+import os
+import numpy as np
+from scipy.spatial import Delaunay
+from typing import Union, Tuple, List, Callable
+from .alphashape import _coordinates, _local_coordinates, _radius_bound, \
+    circumradii, boundary_facets, boundary_mesh
+from .stats import Stats
+
+
+#: The number of simplices measured at once.
+_BLOCK_SIZE = 1 << 20
+
+#: The arrays of a complex that are copied to disk as they are.
+_SPILLED = ('coords', 'simplices', 'neighbors', 'coplanar')
+
+
+def _spill(directory: str, name: str, array: np.ndarray) -> np.memmap:
+    """
+    Copy an array to a ``.npy`` file and map it back into memory.
+
+    Args:
+      directory: the directory of the file
+      name: the name of the file, without its extension
+      array: the array
+
+    Returns:
+      The read only memory map of the file.
+    """
+    path = os.path.join(directory, name + '.npy')
+    np.save(path, array)
+    return np.load(path, mmap_mode='r')
+
+
+class AlphaComplex:
+    """
+    The Delaunay triangulation of a set of points together with the
+    circumradius of every simplex.
+
+    The triangulation and the radii are computed once when the complex is
+    created.  Every alpha value after that only costs a radius comparison and
+    a boundary extraction, which makes the complex the right tool when the
+    same points are evaluated against many alpha values.
+
+    The simplices are kept as the 32 bit index arrays of Qhull and the radii
+    are measured in blocks, so that past the triangulation itself, whose
+    peak Qhull dictates, a complex needs about 41 bytes per simplex in three
+    dimensions, 37 with single precision radii.  See the memory section of
+    the usage documentation.
+
+    The points are triangulated and measured in a frame centered on their
+    bounding box, see ``offset`` and ``scale``, so that large projected or
+    geocentric coordinates keep their precision.  The circumradii are
+    reported in the units of the original coordinates.
+
+    Args:
+      points (list or ``numpy.ndarray`` or ``geopandas.GeoSeries``): an
+        iterable container of points
+      dtype: the floating point type the circumradii are computed and
+        stored in.  ``numpy.float32`` halves the memory of the radii and the
+        traffic of computing them; radii that differ by less than single
+        precision can then tie, which only matters for alpha values right
+        at such a radius.
+      directory: an optional directory to spill the arrays of the complex
+        to.  The arrays are written as ``.npy`` files and memory mapped, so
+        that they live in the page cache instead of the heap, and the
+        complex can be opened again with ``load``, also from another
+        process.
+
+    Attributes:
+      coords: An `N`x`K` array of the point coordinates.
+      simplices: An `S`x(`K`+1) array of vertex indices of the Delaunay
+        simplices.
+      neighbors: An `S`x(`K`+1) array of the simplices opposite each vertex,
+        -1 on the convex hull.
+      coplanar: A `C`x3 array of the points left out of the triangulation, as
+        reported by ``scipy.spatial.Delaunay.coplanar``.
+      radii: A length `S` array of circumradii, infinite for degenerate
+        simplices.
+      degenerate: A length `S` boolean array flagging degenerate simplices.
+      offset: The center of the bounding box of the points.
+      scale: The power of two the centered coordinates were divided by.
+      stats: The ``Stats`` of the triangulation and the radii.
+    """
+
+    #: The filtration read along with a spilled complex, see ``load``.
+    _filtration = None
+
+    def __init__(self, points: Union[List[Tuple[float]], np.ndarray],
+                 dtype: type = np.float64,
+                 directory: Union[None, str] = None):
+        self.stats = Stats()
+        self.coords = _coordinates(points)
+        local, self.offset, self.scale = _local_coordinates(self.coords)
+        num_dims = self.coords.shape[-1]
+        if len(self.coords) < 4:
+            # Too few points to triangulate; alphashape returns the convex
+            # hull for these without consulting the simplices.
+            self.simplices = np.empty((0, num_dims + 1), dtype=np.intc)
+            self.neighbors = np.empty((0, num_dims + 1), dtype=np.intc)
+            self.coplanar = np.empty((0, 3), dtype=np.intc)
+        else:
+            with self.stats.stage('triangulation'):
+                tri = Delaunay(local)
+            self.simplices = tri.simplices
+            self.neighbors = tri.neighbors
+            self.coplanar = tri.coplanar
+            # Release the hyperplane equations of the triangulation, which
+            # outweigh the simplices
+            del tri
+
+        # Spill the arrays to disk before the radii are allocated
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+            for name in _SPILLED:
+                setattr(self, name, _spill(
+                    directory, name, getattr(self, name)))
+            self.radii = np.lib.format.open_memmap(
+                os.path.join(directory, 'radii.npy'), mode='w+',
+                dtype=dtype, shape=(len(self.simplices),))
+            self.degenerate = np.lib.format.open_memmap(
+                os.path.join(directory, 'degenerate.npy'), mode='w+',
+                dtype=bool, shape=(len(self.simplices),))
+            np.save(os.path.join(directory, 'frame.npy'),
+                    np.append(self.offset, self.scale))
+        else:
+            self.radii = np.empty(len(self.simplices), dtype=dtype)
+            self.degenerate = np.empty(len(self.simplices), dtype=bool)
+
+        # Measure the simplices in blocks, so that their vertex coordinates
+        # are never gathered all at once
+        with self.stats.stage('radii'):
+            local = local.astype(dtype, copy=False)
+            for start in range(0, len(self.simplices), _BLOCK_SIZE):
+                block = slice(start, start + _BLOCK_SIZE)
+                self.radii[block], self.degenerate[block] = circumradii(
+                    local[self.simplices[block]], dtype)
+            self.radii *= self.scale
+        if directory is not None:
+            self.radii.flush()
+            self.degenerate.flush()
+        self.stats.counts.update(
+            points=len(self.coords), simplices=len(self.simplices),
+            degenerate=int(np.count_nonzero(self.degenerate)))
+
+    @classmethod
+    def load(cls, directory: str, mmap_mode: Union[None, str] = 'r') -> \
+            'AlphaComplex':
+        """
+        Open a complex that was spilled to a directory.
+
+        The arrays are memory mapped rather than read, so that processes
+        sharing a complex share its pages, and the points are not
+        triangulated again.
+
+        Args:
+          directory: the directory given when the complex was created
+          mmap_mode: the mode the arrays are mapped in, see ``numpy.load``;
+            None reads them into memory.  A ``filtration.npy`` file in the
+            directory is used as the filtration of the complex.
+
+        Returns:
+          The ``AlphaComplex``.
+        """
+        complex_ = cls.__new__(cls)
+        complex_.stats = Stats()
+        for name in _SPILLED + ('radii', 'degenerate'):
+            setattr(complex_, name, np.load(os.path.join(
+                directory, name + '.npy'), mmap_mode=mmap_mode))
+        frame = np.load(os.path.join(directory, 'frame.npy'))
+        complex_.offset, complex_.scale = frame[:-1], float(frame[-1])
+        path = os.path.join(directory, 'filtration.npy')
+        if os.path.exists(path):
+            complex_._filtration = np.load(path, mmap_mode=mmap_mode)
+        complex_.stats.counts.update(
+            points=len(complex_.coords), simplices=len(complex_.simplices),
+            degenerate=int(np.count_nonzero(complex_.degenerate)))
+        return complex_
+
+    def __len__(self) -> int:
+        return len(self.coords)
+
+    def __repr__(self) -> str:
+        return '<AlphaComplex: %d points, %d simplices in %d dimensions>' % (
+            len(self.coords), len(self.simplices), self.coords.shape[-1])
+
+    def filtration(self) -> np.ndarray:
+        """
+        The distinct circumradii of the non-degenerate simplices.
+
+        The alpha shape only changes where 1 / `alpha` crosses one of these
+        values.
+
+        Returns:
+          A sorted array of distinct, finite circumradii.
+        """
+        if self._filtration is not None:
+            return self._filtration
+        return np.unique(self.radii[~self.degenerate])
+
+    def accepted(self, alpha: Union[float, Callable]) -> np.ndarray:
+        """
+        Apply the radius filter for an alpha value.
+
+        Args:
+          alpha (float or callable): alpha value, or a function called with
+            the vertex indices and circumradius of each simplex that returns
+            its alpha value; functions marked with ``vectorized_alpha`` are
+            called once with the arrays of all the simplices and radii
+
+        Returns:
+          A length `S` boolean array that is True for the simplices whose
+          circumradius is smaller than 1 / `alpha`.
+        """
+        if callable(alpha) and getattr(alpha, 'vectorized', False):
+            resolved_alpha = np.asarray(
+                alpha(self.simplices, self.radii), dtype=float)
+            with np.errstate(divide='ignore'):
+                return self.radii < 1.0 / resolved_alpha
+        elif callable(alpha):
+            accepted = np.zeros(len(self.radii), dtype=bool)
+            valid = ~self.degenerate
+            resolved_alpha = np.array([
+                alpha(point_indices, circumradius)
+                for point_indices, circumradius
+                in zip(self.simplices[valid], self.radii[valid])],
+                dtype=float)
+            accepted[valid] = self.radii[valid] < 1.0 / resolved_alpha
+            return accepted
+        return self.radii < _radius_bound(alpha, self.radii.dtype)
+
+    def perimeter(self, alpha: Union[float, Callable]) -> np.ndarray:
+        """
+        Find the perimeter facets of the alpha shape for an alpha value.
+
+        Args:
+          alpha (float or callable): alpha value
+
+        Returns:
+          An `M`x`K` array of vertex indices of the perimeter facets.
+        """
+        return boundary_facets(self.simplices, self.accepted(alpha),
+                               neighbors=self.neighbors)
+
+    def mesh(self, alpha: Union[float, Callable]) -> \
+            Tuple[np.ndarray, np.ndarray]:
+        """
+        Build the outward facing surface mesh of a three dimensional alpha
+        shape as arrays, without constructing a ``trimesh.Trimesh``.
+
+        Args:
+          alpha (float or callable): alpha value
+
+        Returns:
+          The arrays of vertices and triangles, see ``boundary_mesh``.
+        """
+        return boundary_mesh(self.coords, self.simplices,
+                             self.accepted(alpha), self.neighbors)
+
+    def shape(self, alpha: Union[None, float, Callable] = None):
+        """
+        Compute the alpha shape for an alpha value.
+
+        This is equivalent to calling ``alphashape`` with the points of the
+        complex, without triangulating them again.
+
+        Args:
+          alpha (float or callable): alpha value, solved for when not given
+
+        Returns:
+          The resulting geometry, see ``alphashape``.
+        """
+        from .alphashape import alphashape
+        return alphashape(self, alpha)
+
+    def optimize(self, **kwargs) -> float:
+        """
+        Solve for the alpha parameter of the complex.
+
+        Args:
+          kwargs: keyword arguments passed through to ``optimizealpha``
+
+        Returns:
+          float: The optimized alpha parameter
+        """
+        from .optimizealpha import optimizealpha
+        return optimizealpha(self, **kwargs)
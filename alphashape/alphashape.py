@@ -3,19 +3,70 @@ Tools for working with alpha shapes.
 """
 __all__ = ['alphashape']
 
+import sys
 import itertools
 import warnings
 from shapely.ops import unary_union, polygonize
-from shapely.geometry import MultiPoint, MultiLineString
+from shapely.geometry import MultiPoint, MultiLineString, MultiPolygon, \
+    GeometryCollection
+from shapely.geometry.base import BaseGeometry
 from scipy.spatial import Delaunay
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
 import numpy as np
-from typing import Union, Tuple, List
+from typing import Union, Tuple, List, Sequence, TYPE_CHECKING
+from .stats import Stats
+
+if TYPE_CHECKING:
+    from .cache import ComplexCache
 
 try:
-    import geopandas
-    USE_GP = True
+    from shapely import linearrings, polygons, get_coordinates, has_z
+    USE_SHAPELY2 = True
 except ImportError:
-    USE_GP = False
+    USE_SHAPELY2 = False
+
+
+def _loaded_module(name: str):
+    """
+    Look up a module among the ones that have already been imported.
+
+    Geopandas inputs and trimesh results can only exist once their module
+    has been imported, so checking their types against the loaded module
+    spares the import of these packages, which takes longer than an alpha
+    shape of a few thousand points, on every other path.
+
+    Args:
+      name: the name of the module
+
+    Returns:
+      The module, or None if it has not been imported.
+    """
+    return sys.modules.get(name)
+
+
+def _kernels(backend: str):
+    """
+    Look up the compiled kernels of a backend.
+
+    Args:
+      backend: ``'numpy'``, ``'numba'``, or ``'auto'`` for numba when it is
+        installed and numpy otherwise
+
+    Returns:
+      The ``kernels`` module, or None for the NumPy backend.
+    """
+    if backend == 'numpy':
+        return None
+    elif backend not in ('numba', 'auto'):
+        raise ValueError(f'Unknown backend: {backend}')
+    try:
+        from . import kernels
+    except ImportError:
+        if backend == 'numba':
+            raise
+        return None
+    return kernels
 
 
 def circumcenter(points: Union[List[Tuple[float]], np.ndarray]) -> np.ndarray:
@@ -30,7 +81,10 @@ def circumcenter(points: Union[List[Tuple[float]], np.ndarray]) -> np.ndarray:
     Returns:
       The circumcenter of a set of points in barycentric coordinates.
     """
-    points = np.asarray(points)
+    # Barycentric coordinates do not depend on the origin; centering the
+    # points keeps the squared coordinates below small.
+    points = np.asarray(points, dtype=float)
+    points = points - points.mean(axis=0)
     num_rows, num_columns = points.shape
     A = np.bmat([[2 * np.dot(points, points.T),
                   np.ones((num_rows, 1))],
@@ -56,6 +110,75 @@ def circumradius(points: Union[List[Tuple[float]], np.ndarray]) -> float:
     return np.linalg.norm(points[0, :] - np.dot(circumcenter(points), points))
 
 
+def circumradii(points: np.ndarray, dtype: type = np.float64) -> \
+        Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate the circumradii of a stack of simplices in one pass.
+
+    Two and three dimensional simplices are solved in closed form, higher
+    dimensions with a stacked linear solve.  Simplices whose vertices lie in a
+    lower dimensional space have no circumsphere; they are flagged in the
+    returned mask and given an infinite radius so that no radius filter will
+    accept them.
+
+    Args:
+      points: An `S`x(`K`+1)x`K` array holding the vertices of `S` simplices
+        in `K` dimensional space, such as ``coords[tri.simplices]``.
+      dtype: The floating point type the radii are computed in.
+        ``numpy.float32`` halves the memory traffic of large inputs, at the
+        cost of precision; it is best used with coordinates that are
+        centered and scaled, see ``AlphaComplex``.
+
+    Returns:
+      A length `S` array of circumradii, and a length `S` boolean array that
+      is True for degenerate simplices.
+    """
+    points = np.asarray(points, dtype=dtype)
+    num_simplices, num_vertices, num_dims = points.shape
+    if num_vertices != num_dims + 1:
+        raise ValueError('Expected simplices with %d vertices in %d '
+                         'dimensions, got %d' % (
+                             num_dims + 1, num_dims, num_vertices))
+
+    # Work relative to the first vertex of every simplex.  The circumradius is
+    # translation invariant and this keeps the products below small.
+    edges = points[:, 1:, :] - points[:, :1, :]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if num_dims == 2:
+            b, c = edges[:, 0, :], edges[:, 1, :]
+            b2 = np.einsum('ij,ij->i', b, b)
+            c2 = np.einsum('ij,ij->i', c, c)
+            denominator = 2. * (b[:, 0] * c[:, 1] - b[:, 1] * c[:, 0])
+            ux = (c[:, 1] * b2 - b[:, 1] * c2) / denominator
+            uy = (b[:, 0] * c2 - c[:, 0] * b2) / denominator
+            radii = np.hypot(ux, uy)
+        elif num_dims == 3:
+            b, c, d = edges[:, 0, :], edges[:, 1, :], edges[:, 2, :]
+            b2 = np.einsum('ij,ij->i', b, b)[:, None]
+            c2 = np.einsum('ij,ij->i', c, c)[:, None]
+            d2 = np.einsum('ij,ij->i', d, d)[:, None]
+            c_x_d = np.cross(c, d)
+            denominator = 2. * np.einsum('ij,ij->i', b, c_x_d)
+            center = (b2 * c_x_d + c2 * np.cross(d, b) +
+                      d2 * np.cross(b, c)) / denominator[:, None]
+            radii = np.linalg.norm(center, axis=1)
+        else:
+            # The circumcenter u, relative to the first vertex, satisfies
+            # 2 e_i . u = |e_i|^2 for every edge e_i leaving that vertex.
+            lhs = 2. * edges
+            rhs = np.einsum('ijk,ijk->ij', edges, edges)
+            denominator = np.linalg.det(lhs)
+            radii = np.full(num_simplices, np.inf, dtype=points.dtype)
+            solvable = np.isfinite(denominator) & (denominator != 0.)
+            if np.any(solvable):
+                center = np.linalg.solve(
+                    lhs[solvable], rhs[solvable][..., None])[..., 0]
+                radii[solvable] = np.linalg.norm(center, axis=1)
+    degenerate = (denominator == 0.) | ~np.isfinite(radii)
+    radii[degenerate] = np.inf
+    return radii, degenerate
+
+
 def alphasimplices(points: Union[List[Tuple[float]], np.ndarray]) -> \
         Union[List[Tuple[float]], np.ndarray]:
     """
@@ -68,20 +191,522 @@ def alphasimplices(points: Union[List[Tuple[float]], np.ndarray]) -> \
     Yields:
       A simplex, and its circumradius as a tuple.
     """
-    coords = np.asarray(points)
+    coords, _, scale = _local_coordinates(np.asarray(points, dtype=float))
     tri = Delaunay(coords)
+    radii, degenerate = circumradii(coords[tri.simplices])
+    radii *= scale
+    if np.any(degenerate):
+        warnings.warn('Singular matrix. Likely caused by all points '
+                      'lying in an N-1 space.')
+
+    for simplex, radius in zip(tri.simplices[~degenerate],
+                               radii[~degenerate]):
+        yield simplex, radius
+
+
+def _local_coordinates(coords: np.ndarray) -> \
+        Tuple[np.ndarray, np.ndarray, float]:
+    """
+    Move coordinates into a frame centered on their bounding box.
+
+    Projected and geocentric coordinates are often millions of units away
+    from the origin while neighboring points are only a few units apart,
+    which leaves few significant bits for the triangulation and the radius
+    computations.  The points are shifted to the center of their bounding
+    box and divided by a power of two, which is exact, so that they fit in
+    [-1, 1].  Vertex indices carry over unchanged, and lengths measured in
+    the local frame are mapped back by multiplying them with the scale.
+
+    Points whose bounding box is no farther from the origin than it is wide
+    lose no significant bits and are not shifted, which keeps the
+    triangulation of co-spherical points exactly as Qhull breaks the ties in
+    the original frame.
+
+    Args:
+      coords: An `N`x`K` array of coordinates.
+
+    Returns:
+      The `N`x`K` array of local coordinates, the length `K` offset and the
+      scale, such that ``coords == local * scale + offset`` up to rounding.
+    """
+    if not len(coords):
+        return coords, np.zeros(coords.shape[-1]), 1.
+    lower, upper = coords.min(axis=0), coords.max(axis=0)
+    offset = (lower + upper) / 2.
+    extent = float(np.max(upper - lower)) / 2.
+    if not np.max(np.abs(offset)) > extent:
+        offset = np.zeros_like(offset)
+    scale = float(np.ldexp(1., np.frexp(extent)[1])) if extent > 0 else 1.
+    return (coords - offset) / scale, offset, scale
+
+
+def _radius_bound(alpha: float, dtype: type = np.float64):
+    """
+    The bound 1 / `alpha` of the radius filter, in the precision of the radii.
+
+    The bound is rounded up to the next value of `dtype`, so that comparing
+    radii of that type against it accepts exactly the radii below 1 /
+    `alpha`, as a comparison in double precision would.
+
+    Args:
+      alpha: alpha value
+      dtype: the floating point type of the radii
+
+    Returns:
+      The bound as a scalar of type `dtype`.
+    """
+    bound = 1.0 / alpha
+    rounded = np.dtype(dtype).type(bound)
+    if float(rounded) < bound:
+        rounded = np.nextafter(rounded, rounded.dtype.type(np.inf))
+    return rounded
+
+
+def _facet_keys(facets: np.ndarray) -> np.ndarray:
+    """
+    Reduce row-sorted facets to keys that compare equal for equal facets.
+
+    Facets are packed into one int64 per row whenever the vertex indices fit,
+    and otherwise viewed as one opaque void scalar per row.
+
+    Args:
+      facets: An `F`x`D` integer array of facets, each row sorted.
+
+    Returns:
+      A length `F` array of keys.
+    """
+    num_facets, num_vertices = facets.shape
+    base = int(facets.max()) + 1 if num_facets else 1
+    if num_vertices * np.log2(base) < 63:
+        keys = np.zeros(num_facets, dtype=np.int64)
+        for column in range(num_vertices):
+            keys *= base
+            keys += facets[:, column]
+        return keys
+    facets = np.ascontiguousarray(facets)
+    return facets.view(np.dtype((np.void, facets.dtype.itemsize *
+                                 num_vertices))).ravel()
+
+
+def boundary_facets(simplices: np.ndarray,
+                    mask: Union[None, np.ndarray] = None,
+                    return_index: bool = False,
+                    neighbors: Union[None, np.ndarray] = None,
+                    backend: str = 'numpy') -> \
+        Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+    """
+    Find the facets that belong to exactly one of the given simplices.
+
+    These are the perimeter edges in two dimensions, the surface triangles in
+    three dimensions, and so on.  Each facet keeps the vertex order it has
+    within its simplex.
+
+    Without `neighbors`, the facets of all the simplices are packed into
+    keys and counted, which takes a few hundred bytes per simplex.  With
+    them, a facet is on the boundary when the simplex across it is missing
+    or masked out, which needs no sorting and a few bytes per simplex.  The
+    ``numba`` backend does either in two compiled passes over the simplices,
+    counting the facets in a hash table rather than sorting them, and
+    allocates little beyond its output.
+
+    Args:
+      simplices: An `S`x(`K`+1) array of vertex indices, such as
+        ``tri.simplices``.
+      mask: An optional length `S` boolean array selecting the simplices to
+        consider.
+      return_index: Also return the index of the simplex each facet belongs
+        to.
+      neighbors: An optional `S`x(`K`+1) array of the simplices opposite
+        each vertex, -1 on the convex hull, such as ``tri.neighbors``.
+      backend: ``'numpy'``, ``'numba'``, or ``'auto'`` for numba when it is
+        installed; the results are the same
+
+    Returns:
+      An `M`x`K` array of vertex indices of the boundary facets, and if
+      requested a length `M` array of indices into `simplices`.
+    """
+    simplices = np.asarray(simplices)
+    num_vertices = simplices.shape[-1]
+    kernels = _kernels(backend)
+    if kernels is not None and len(simplices):
+        mask = np.ones(len(simplices), dtype=bool) if mask is None else \
+            np.asarray(mask, dtype=bool)
+        base = int(simplices.max()) + 1
+        if neighbors is not None:
+            facets, owners = kernels.adjacent_boundary(
+                simplices, np.asarray(neighbors), mask)
+        elif (num_vertices - 1) * np.log2(base) < 63:
+            facets, owners = kernels.hashed_boundary(simplices, mask, base)
+        else:
+            kernels = None
+        if kernels is not None:
+            return (facets, owners) if return_index else facets
+    facet_vertices = np.array(list(itertools.combinations(
+        range(num_vertices), r=num_vertices - 1)))
+    if neighbors is not None:
+        return _adjacent_boundary_facets(
+            simplices, mask, return_index, neighbors, facet_vertices)
+    if mask is not None:
+        owners = np.flatnonzero(mask)
+        simplices = simplices[owners]
+    else:
+        owners = np.arange(len(simplices))
+    facets = simplices[:, facet_vertices].reshape(-1, num_vertices - 1)
+    if len(facets):
+        keys = _facet_keys(np.sort(facets, axis=1))
+        _, first, counts = np.unique(
+            keys, return_index=True, return_counts=True)
+        index = np.sort(first[counts == 1])
+    else:
+        index = np.empty(0, dtype=int)
+    if return_index:
+        return facets[index], owners[index // num_vertices]
+    return facets[index]
+
+
+def _adjacent_boundary_facets(simplices: np.ndarray,
+                              mask: Union[None, np.ndarray],
+                              return_index: bool, neighbors: np.ndarray,
+                              facet_vertices: np.ndarray) -> \
+        Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+    """
+    Find the boundary facets from the adjacency of the simplices, see
+    ``boundary_facets``.
+    """
+    if mask is None:
+        owners = np.arange(len(simplices))
+        # Facet c of the combinations leaves out vertex K - c
+        outer = np.asarray(neighbors)[:, ::-1] < 0
+    else:
+        mask = np.asarray(mask, dtype=bool)
+        owners = np.flatnonzero(mask)
+        adjacent = np.asarray(neighbors)[owners, ::-1]
+        outer = (adjacent < 0) | ~mask[adjacent]
+    rows, columns = np.nonzero(outer)
+    owners = owners[rows]
+    facets = simplices[owners[:, None], facet_vertices[columns]]
+    if return_index:
+        return facets, owners
+    return facets
+
 
-    for simplex in tri.simplices:
-        simplex_points = coords[simplex]
-        try:
-            yield simplex, circumradius(simplex_points)
-        except np.linalg.LinAlgError:
-            warnings.warn('Singular matrix. Likely caused by all points '
-                          'lying in an N-1 space.')
+def boundary_mesh(coords: np.ndarray, simplices: np.ndarray,
+                  mask: Union[None, np.ndarray] = None,
+                  neighbors: Union[None, np.ndarray] = None) -> \
+        Tuple[np.ndarray, np.ndarray]:
+    """
+    Build the surface mesh of a set of tetrahedra.
+
+    Every boundary triangle is wound counter-clockwise when seen from
+    outside, which is decided by the side of the triangle that the opposite
+    vertex of its tetrahedron lies on, so no repair of the normals is
+    needed.  Only the vertices referenced by the triangles are kept.
+
+    Args:
+      coords: An `N`x3 array of coordinates.
+      simplices: An `S`x4 array of vertex indices of tetrahedra.
+      mask: An optional length `S` boolean array selecting the tetrahedra to
+        consider.
+      neighbors: An optional `S`x4 array of the tetrahedra opposite each
+        vertex, see ``boundary_facets``.
+
+    Returns:
+      An `M`x3 array of the vertices of the mesh, in the order of the input
+      coordinates, and an `F`x3 array of indices into it of the outward
+      facing triangles.
+    """
+    simplices = np.asarray(simplices)
+    faces, owners = boundary_facets(simplices, mask, return_index=True,
+                                    neighbors=neighbors)
+    return _mesh(np.asarray(coords), simplices, faces, owners)
+
+
+def _mesh(coords: np.ndarray, simplices: np.ndarray, faces: np.ndarray,
+          owners: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Orient and compact the boundary triangles of tetrahedra, see
+    ``boundary_mesh``.
+
+    Args:
+      coords: An `N`x3 array of coordinates.
+      simplices: An `S`x4 array of vertex indices of tetrahedra.
+      faces: An `F`x3 array of the boundary triangles.
+      owners: A length `F` array of the tetrahedron of each triangle.
+
+    Returns:
+      The `M`x3 array of vertices and the `F`x3 array of triangles.
+    """
+    # Flip the triangles whose normal points at the opposite vertex
+    opposite = simplices[owners].sum(axis=1) - faces.sum(axis=1)
+    start = coords[faces[:, 0]]
+    normal = np.cross(coords[faces[:, 1]] - start, coords[faces[:, 2]] - start)
+    inward = np.einsum('ij,ij->i', normal, coords[opposite] - start) > 0
+    faces[inward] = faces[inward, ::-1]
+
+    # Keep the referenced vertices only
+    used, faces = np.unique(faces, return_inverse=True)
+    return coords[used], faces.reshape(-1, 3)
+
+
+def _rings(coords: np.ndarray, edges: np.ndarray) -> List[np.ndarray]:
+    """
+    Chain directed perimeter edges into closed rings.
+
+    Every edge is followed by the edge leaving its end vertex.  Where several
+    edges leave the same vertex, the regions on the left of the edges meet
+    at that vertex, and the edge that follows is the first one clockwise
+    from the incoming edge, which keeps each region on its own ring.
+
+    Args:
+      coords: An `N`x2 array of coordinates.
+      edges: An `M`x2 array of directed edges, each with the interior of the
+        shape on its left.
+
+    Returns:
+      A list of arrays of edge indices, one per ring, in walking order.
+    """
+    starts, ends = edges[:, 0], edges[:, 1]
+    order = np.argsort(starts, kind='stable')
+    first = np.searchsorted(starts[order], ends, side='left')
+    last = np.searchsorted(starts[order], ends, side='right')
+    following = order[np.minimum(first, len(order) - 1)]
+
+    # Resolve the vertices where several regions meet
+    for edge in np.flatnonzero(last - first > 1):
+        candidates = order[first[edge]:last[edge]]
+        vertex = coords[ends[edge]]
+        incoming = coords[starts[edge]] - vertex
+        outgoing = coords[ends[candidates]] - vertex
+        clockwise = np.mod(
+            np.arctan2(incoming[1], incoming[0]) -
+            np.arctan2(outgoing[:, 1], outgoing[:, 0]), 2 * np.pi)
+        following[edge] = candidates[np.argmin(clockwise)]
+
+    following = following.tolist()
+    visited = [False] * len(following)
+    rings = []
+    for edge in range(len(following)):
+        ring = []
+        while not visited[edge]:
+            visited[edge] = True
+            ring.append(edge)
+            edge = following[edge]
+        if ring:
+            rings.append(np.array(ring))
+    return rings
+
+
+def _filled(neighbors: np.ndarray, accepted: np.ndarray) -> np.ndarray:
+    """
+    Add the rejected simplices enclosed by accepted ones to a selection.
+
+    The rejected simplices that reach beyond the convex hull through shared
+    facets are outside of the shape; every other rejected simplex lies in a
+    hole enclosed by accepted simplices, which ``polygonize`` fills.
+
+    Args:
+      neighbors: An `S`x(`K`+1) array of the simplices opposite each vertex,
+        -1 on the convex hull.
+      accepted: A length `S` boolean array of the accepted simplices.
+
+    Returns:
+      A length `S` boolean array of the accepted and the enclosed simplices.
+    """
+    rejected = np.flatnonzero(~accepted)
+    outside = len(accepted)
+    adjacent = np.where(neighbors[rejected] < 0, outside,
+                        neighbors[rejected])
+    linked = (adjacent == outside) | ~accepted[np.minimum(adjacent,
+                                                          outside - 1)]
+    graph = csr_matrix(
+        (np.ones(np.count_nonzero(linked)),
+         (np.repeat(rejected, neighbors.shape[1])[linked.ravel()],
+          adjacent[linked])),
+        shape=(outside + 1, outside + 1))
+    _, labels = connected_components(graph, directed=False)
+    return accepted | (labels[:-1] != labels[-1])
+
+
+def _polygons(coords: np.ndarray, simplices: np.ndarray,
+              edges: np.ndarray, owners: np.ndarray):
+    """
+    Assemble the polygons covered by the accepted triangles.
+
+    The perimeter is expected of the selection with the enclosed regions
+    filled, see ``_filled``, matching the faces that ``polygonize`` finds
+    inside it.  The perimeter is oriented with the interior on the left and
+    walked into counter-clockwise rings, each of which is the shell of one
+    polygon.
+
+    Args:
+      coords: An `N`x2 array of coordinates.
+      simplices: An `S`x3 array of triangles.
+      edges: An `M`x2 array of the perimeter edges.
+      owners: A length `M` array of the triangles the edges belong to.
+
+    Returns:
+      ``shapely.geometry.Polygon`` or ``shapely.geometry.MultiPolygon`` or
+      an empty ``shapely.geometry.GeometryCollection``
+    """
+    if not len(edges):
+        return GeometryCollection()
+    result, _ = _shells(coords, simplices, edges, owners)
+    if len(result) == 1:
+        return result[0]
+    return MultiPolygon(list(result))
+
+
+def _shells(coords: np.ndarray, simplices: np.ndarray, edges: np.ndarray,
+            owners: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Walk a perimeter into rings and build one polygon per ring, see
+    ``_polygons``.
+
+    Args:
+      coords: An `N`x2 array of coordinates.
+      simplices: An `S`x3 array of triangles.
+      edges: A nonempty `M`x2 array of the perimeter edges.
+      owners: A length `M` array of the triangles the edges belong to.
+
+    Returns:
+      An object array of ``shapely.geometry.Polygon``, one per ring, and an
+      array of the first vertex of every ring.
+    """
+    # Orient every perimeter edge with its triangle on the left
+    opposite = simplices[owners].sum(axis=1) - edges.sum(axis=1)
+    start, end, apex = coords[edges[:, 0]], coords[edges[:, 1]], \
+        coords[opposite]
+    cross = (end[:, 0] - start[:, 0]) * (apex[:, 1] - start[:, 1]) - \
+        (end[:, 1] - start[:, 1]) * (apex[:, 0] - start[:, 0])
+    edges = np.where((cross < 0)[:, None], edges[:, ::-1], edges)
+
+    # Build one polygon per ring
+    rings = _rings(coords, edges)
+    shells = np.concatenate(
+        [coords[edges[ring, 0]][np.r_[:len(ring), 0]] for ring in rings])
+    result = polygons(linearrings(shells, indices=np.repeat(
+        np.arange(len(rings)), [len(ring) + 1 for ring in rings])))
+    return result, edges[[ring[0] for ring in rings], 0]
+
+
+def _geometry(coords: np.ndarray, simplices: np.ndarray,
+              neighbors: Union[None, np.ndarray], accepted: np.ndarray,
+              stats: Stats, backend: str = 'numpy'):
+    """
+    Build the alpha shape of the accepted simplices.
+
+    Args:
+      coords: An `N`x`K` array of coordinates.
+      simplices: An `S`x(`K`+1) array of vertex indices.
+      neighbors: An `S`x(`K`+1) array of the simplices opposite each vertex,
+        or None when unknown.
+      accepted: A length `S` boolean array of the accepted simplices.
+      stats: The ``Stats`` to record the stages in.
+      backend: The backend of the boundary facets, see ``boundary_facets``.
+
+    Returns:
+      The geometry, see ``alphashape``.
+    """
+    stats.counts['accepted'] = int(np.count_nonzero(accepted))
+    assemble = coords.shape[-1] == 2 and USE_SHAPELY2 and \
+        neighbors is not None
+
+    # Collect the facets that belong to exactly one accepted simplex.  The
+    # polygons are assembled from the perimeter of the regions enclosed by
+    # accepted triangles filled in, so that is the only perimeter found.
+    with stats.stage('boundary'):
+        if assemble:
+            accepted = _filled(neighbors, accepted)
+        perimeter_edges, owners = boundary_facets(
+            simplices, accepted, return_index=True, neighbors=neighbors,
+            backend=backend)
+    stats.counts['facets'] = len(perimeter_edges)
+
+    if coords.shape[-1] > 3:
+        return perimeter_edges
+    elif coords.shape[-1] == 3:
+        import trimesh
+        with stats.stage('mesh'):
+            vertices, faces = _mesh(coords, simplices, perimeter_edges,
+                                    owners)
+            return trimesh.Trimesh(vertices=vertices, faces=faces,
+                                   process=False)
+
+    # Create the resulting polygon from the edge points
+    with stats.stage('polygons'):
+        if assemble:
+            result = _polygons(coords, simplices, perimeter_edges, owners)
+        else:
+            m = MultiLineString(list(coords[perimeter_edges]))
+            triangles = list(polygonize(m))
+            result = unary_union(triangles)
+    stats.counts['rings'] = sum(
+        1 + len(polygon.interiors) for polygon in getattr(
+            result, 'geoms', [result]) if hasattr(polygon, 'interiors'))
+    return result
+
+
+def _coordinates(points: Union[List[Tuple[float]], np.ndarray]) -> \
+        np.ndarray:
+    """
+    Convert a container of points to an array of coordinates.
+
+    Contiguous float64 arrays are returned as they are, without a copy.
+    Shapely and geopandas geometries are read with the vectorized coordinate
+    accessors of shapely 2.
+
+    Args:
+      points (list or ``numpy.ndarray`` or ``shapely.geometry.MultiPoint``
+        or ``geopandas.GeoSeries`` or ``geopandas.GeoDataFrame``): an
+        iterable container of points
+
+    Returns:
+      An `N`x`K` array of coordinates.
+    """
+    geopandas = _loaded_module('geopandas')
+    if geopandas is not None and isinstance(points, geopandas.GeoDataFrame):
+        points = points['geometry']
+    if geopandas is not None and isinstance(points, geopandas.GeoSeries):
+        if not USE_SHAPELY2:
+            return np.array([point.coords[0] for point in points])
+        points = np.asarray(points.values)
+    if USE_SHAPELY2 and (isinstance(points, BaseGeometry) or (
+            isinstance(points, np.ndarray) and points.dtype == object)):
+        return get_coordinates(points, include_z=bool(np.any(has_z(points))))
+    return np.ascontiguousarray(points, dtype=float)
+
+
+def _convex_hull(points: Union[List[Tuple[float]], np.ndarray], crs):
+    """
+    The convex hull of a set of points, as returned by ``alphashape``.
+
+    Args:
+      points: an iterable container of points
+      crs: the coordinate reference system of a geodataframe input, or None
+
+    Returns:
+      The convex hull, in a ``geopandas.GeoDataFrame`` when `crs` is given.
+    """
+    if not isinstance(points, MultiPoint):
+        points = MultiPoint(list(points))
+    result = points.convex_hull
+    if crs:
+        geopandas = _loaded_module('geopandas')
+        result = geopandas.GeoDataFrame(geopandas.GeoSeries(
+            result)).rename(columns={0: 'geometry'}).set_geometry(
+                'geometry')
+        result.crs = crs
+    return result
 
 
 def alphashape(points: Union[List[Tuple[float]], np.ndarray],
-               alpha: Union[None, float] = None):
+               alpha: Union[None, float] = None,
+               tiles: Union[None, int, Sequence[int]] = None,
+               processes: Union[None, int] = None,
+               dtype: type = np.float64, return_stats: bool = False,
+               cache: Union[None, 'ComplexCache'] = None,
+               prefilter: Union[None, str, Sequence[str]] = None,
+               backend: str = 'numpy'):
     """
     Compute the alpha shape (concave hull) of a set of points.  If the number
     of points in the input is three or less, the convex hull is returned to the
@@ -92,16 +717,53 @@ def alphashape(points: Union[List[Tuple[float]], np.ndarray],
 
       points (list or ``shapely.geometry.MultiPoint`` or \
           ``geopandas.GeoDataFrame``): an iterable container of points
-      alpha (float): alpha value
+      alpha (float or callable): alpha value, or a function returning the
+        alpha value of each simplex, see ``AlphaComplex.accepted``
+      tiles (int or sequence of int): split the bounding box of the points
+        into this many overlapping tiles along every axis, or along each axis
+        when given a sequence, and triangulate the tiles independently; the
+        tiles overlap by 2 / `alpha`, so the result matches the untiled
+        alpha shape.  Requires a constant, positive alpha value.
+      processes (int): number of worker processes for the tiles; all the
+        available cores when not given
+      dtype: the floating point type the circumradii are computed and
+        stored in; ``numpy.float32`` halves their memory traffic, see
+        ``AlphaComplex``
+      return_stats (bool): also return the durations and counts of the
+        stages, see ``Stats``
+      cache (``ComplexCache``): a cache to take the triangulation and radii
+        from, and to store them in on a miss
+      prefilter (str or sequence of str): reduce the points before they are
+        triangulated, with ``'duplicates'``, ``'interior'`` or ``'grid'``,
+        see ``prefilter.prefilter_points``; the first two leave the shape
+        unchanged.  The number of dropped points is counted as
+        ``prefiltered`` in the ``Stats``.
+      backend (str): ``'numpy'``, ``'numba'``, or ``'auto'`` for numba when
+        it is installed, the implementation of the boundary facets, see
+        ``boundary_facets``
 
     Returns:
 
       ``shapely.geometry.Polygon`` or ``shapely.geometry.LineString`` or
-      ``shapely.geometry.Point`` or ``geopandas.GeoDataFrame``: \
-          the resulting geometry
+      ``shapely.geometry.Point`` or ``geopandas.GeoDataFrame`` or
+      ``trimesh.Trimesh`` or ``numpy.ndarray``: \
+          the resulting geometry; for more than three dimensions an array of
+          the vertex indices of the perimeter facets, and if requested the
+          ``Stats``
     """
+    stats = Stats()
+
+    # If given an alpha complex, reuse its triangulation
+    from .alphacomplex import AlphaComplex
+    if isinstance(points, AlphaComplex):
+        complex_ = points
+        points = complex_.coords
+    else:
+        complex_ = None
+
     # If given a geodataframe, extract the geometry
-    if USE_GP and isinstance(points, geopandas.GeoDataFrame):
+    geopandas = _loaded_module('geopandas')
+    if geopandas is not None and isinstance(points, geopandas.GeoDataFrame):
         crs = points.crs
         points = points['geometry']
     else:
@@ -111,81 +773,66 @@ def alphashape(points: Union[List[Tuple[float]], np.ndarray],
     # return the convex hull.
     if len(points) < 4 or (alpha is not None and not callable(
             alpha) and alpha <= 0):
-        if not isinstance(points, MultiPoint):
-            points = MultiPoint(list(points))
-        result = points.convex_hull
-        if crs:
-            gdf = geopandas.GeoDataFrame(geopandas.GeoSeries(result)).rename(
-                columns={0: 'geometry'}).set_geometry('geometry')
-            gdf.crs = crs
-            return gdf
-        else:
-            return result
-
-    # Determine alpha parameter if one is not given
-    if alpha is None:
-        try:
-            from optimizealpha import optimizealpha
-        except ImportError:
-            from .optimizealpha import optimizealpha
-        alpha = optimizealpha(points)
-
-    # Convert the points to a numpy array
-    if USE_GP and isinstance(points, geopandas.geoseries.GeoSeries):
-        coords = np.array([point.coords[0] for point in points])
-    else:
-        coords = np.array(points)
-
-    # Create a set to hold unique edges of simplices that pass the radius
-    # filtering
-    edges = set()
-
-    # Create a set to hold unique edges of perimeter simplices.
-    # Whenever a simplex is found that passes the radius filter, its edges
-    # will be inspected to see if they already exist in the `edges` set.  If an
-    # edge does not already exist there, it will be added to both the `edges`
-    # set and the `permimeter_edges` set.  If it does already exist there, it
-    # will be removed from the `perimeter_edges` set if found there.  This is
-    # taking advantage of the property of perimeter edges that each edge can
-    # only exist once.
-    perimeter_edges = set()
-
-    for point_indices, circumradius in alphasimplices(coords):
-        if callable(alpha):
-            resolved_alpha = alpha(point_indices, circumradius)
-        else:
-            resolved_alpha = alpha
-
-        # Radius filter
-        if circumradius < 1.0 / resolved_alpha:
-            for edge in itertools.combinations(
-                    point_indices, r=coords.shape[-1]):
-                if all([e not in edges for e in itertools.combinations(
-                        edge, r=len(edge))]):
-                    edges.add(edge)
-                    perimeter_edges.add(edge)
-                else:
-                    perimeter_edges -= set(itertools.combinations(
-                        edge, r=len(edge)))
+        result = _convex_hull(points, crs)
+        return (result, stats) if return_stats else result
 
-    if coords.shape[-1] > 3:
-        return perimeter_edges
-    elif coords.shape[-1] == 3:
-        import trimesh
-        result = trimesh.Trimesh(vertices=coords, faces=list(perimeter_edges))
-        trimesh.repair.fix_normals(result)
-        return result
+    # Drop the points that cannot change the shape before triangulating, and
+    # fall back to the convex hull again if fewer than four remain
+    if prefilter and complex_ is None:
+        from .prefilter import prefilter_points
+        with stats.stage('prefilter'):
+            coords = _coordinates(points)
+            points = prefilter_points(coords, alpha, prefilter)
+        stats.counts['prefiltered'] = len(coords) - len(points)
+        if len(points) < 4:
+            result = _convex_hull(points, crs)
+            return (result, stats) if return_stats else result
 
-    # Create the resulting polygon from the edge points
-    m = MultiLineString([coords[np.array(edge)] for edge in perimeter_edges])
-    triangles = list(polygonize(m))
-    result = unary_union(triangles)
+    if tiles is not None:
+        # Triangulate the points tile by tile and stitch the accepted
+        # simplices of all the tiles together
+        if alpha is None or callable(alpha):
+            raise ValueError('Tiled alpha shapes require a constant alpha '
+                             'value')
+        from .tiling import tiled_simplices
+        coords = _coordinates(points)
+        with stats.stage('tiling'):
+            simplices = tiled_simplices(coords, alpha, tiles, processes,
+                                        dtype)
+        stats.counts['points'] = len(coords)
+        neighbors = None
+        accepted = np.ones(len(simplices), dtype=bool)
+    else:
+        # Triangulate the points and compute every circumradius in one pass.
+        # Degenerate simplices carry an infinite radius and are never
+        # accepted.
+        if complex_ is None and cache is not None:
+            complex_ = cache.get(points, dtype)
+            stats.update(complex_.stats)
+        elif complex_ is None:
+            complex_ = AlphaComplex(points, dtype)
+            stats.update(complex_.stats)
+        coords = complex_.coords
+
+        # Determine alpha parameter if one is not given
+        if alpha is None:
+            try:
+                from optimizealpha import optimizealpha
+            except ImportError:
+                from .optimizealpha import optimizealpha
+            alpha, optimizer_stats = optimizealpha(
+                complex_, return_stats=True)
+            stats.update(optimizer_stats)
+        simplices = complex_.simplices
+        neighbors = complex_.neighbors
+        with stats.stage('filtering'):
+            accepted = complex_.accepted(alpha)
+    result = _geometry(coords, simplices, neighbors, accepted, stats,
+                       backend)
 
     # Convert to pandas geodataframe object if that is what was an input
-    if crs:
-        gdf = geopandas.GeoDataFrame(geopandas.GeoSeries(result)).rename(
+    if crs and coords.shape[-1] == 2:
+        result = geopandas.GeoDataFrame(geopandas.GeoSeries(result)).rename(
             columns={0: 'geometry'}).set_geometry('geometry')
-        gdf.crs = crs
-        return gdf
-    else:
-        return result
+        result.crs = crs
+    return (result, stats) if return_stats else result
@@ -0,0 +1,195 @@
+"""
+Alpha shapes of many groups of points at once.
+"""
+__all__ = ['alphashape_many']
+
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+import numpy as np
+import shapely
+from shapely.geometry import GeometryCollection
+from scipy.spatial import Delaunay
+from typing import Union, Tuple, List, Callable
+from .alphashape import alphashape, boundary_facets, circumradii, \
+    _coordinates, _filled, _loaded_module, _local_coordinates, \
+    _radius_bound, _shells, USE_SHAPELY2
+
+
+def _batched_shapes(coords: np.ndarray, offsets: np.ndarray,
+                    alpha: float) -> np.ndarray:
+    """
+    Compute the two dimensional alpha shapes of consecutive groups of points.
+
+    Every group is triangulated on its own, in the frame ``AlphaComplex``
+    uses, and the triangulations are joined into one with disjoint vertex
+    and simplex indices.  The radii, the radius filter, the filling of the
+    enclosed regions, the boundary and the rings of all the groups are then
+    found in one pass each, and the shapes are those of ``alphashape``.
+
+    Args:
+      coords: An `N`x2 array of the points of the groups, one after another.
+      offsets: The index of the first point of every group, followed by `N`.
+      alpha: a positive alpha value
+
+    Returns:
+      An object array of the alpha shape of every group.
+    """
+    num_groups = len(offsets) - 1
+    local, scales, simplices, neighbors = [], [], [], []
+    num_simplices = 0
+    for group in range(num_groups):
+        group_local, _, scale = _local_coordinates(
+            coords[offsets[group]:offsets[group + 1]])
+        tri = Delaunay(group_local)
+        local.append(group_local)
+        scales.append(np.full(len(tri.simplices), scale))
+        simplices.append(tri.simplices + offsets[group])
+        neighbors.append(np.where(tri.neighbors < 0, -1,
+                                  tri.neighbors + num_simplices))
+        num_simplices += len(tri.simplices)
+    simplices = np.concatenate(simplices)
+    neighbors = np.concatenate(neighbors)
+    radii, _ = circumradii(np.concatenate(local)[simplices])
+    radii *= np.concatenate(scales)
+
+    # Fill and walk the perimeters of all the groups together
+    accepted = _filled(neighbors, radii < _radius_bound(alpha))
+    edges, owners = boundary_facets(simplices, accepted, return_index=True,
+                                    neighbors=neighbors)
+    results = np.array([GeometryCollection()] * num_groups, dtype=object)
+    if not len(edges):
+        return results
+    shells, starts = _shells(coords, simplices, edges, owners)
+    groups = np.searchsorted(offsets, starts, side='right') - 1
+    counts = np.bincount(groups, minlength=num_groups)
+    single = counts[groups] == 1
+    results[groups[single]] = shells[single]
+    if not single.all():
+        multiple, compact = np.unique(groups[~single], return_inverse=True)
+        results[multiple] = shapely.multipolygons(shells[~single],
+                                                  indices=compact)
+    return results
+
+
+def _looped_shapes(coords: np.ndarray, offsets: np.ndarray,
+                   alpha: Union[None, float, Callable]) -> np.ndarray:
+    """
+    Compute the alpha shapes of consecutive groups of points one by one, see
+    ``_batched_shapes``.
+    """
+    results = np.empty(len(offsets) - 1, dtype=object)
+    for group in range(len(results)):
+        results[group] = alphashape(
+            coords[offsets[group]:offsets[group + 1]], alpha)
+    return results
+
+
+def alphashape_many(points: Union[List[Tuple[float]], np.ndarray],
+                    group_ids: Union[List, np.ndarray],
+                    alpha: Union[None, float, Callable] = None,
+                    workers: Union[None, int] = None,
+                    executor: str = 'thread',
+                    parallel_threshold: int = 10000):
+    """
+    Compute one alpha shape per group of points.
+
+    The coordinates are extracted once for all the groups.  Groups of three
+    or fewer points, and every group when `alpha` is zero or less, are
+    turned into convex hulls with a single vectorized call.  Groups of at
+    least `parallel_threshold` points are sent to a pool of workers one by
+    one, and the groups in between in batches of about that many points.
+    Given a constant alpha value, a batch of two dimensional groups skips
+    the setup of every ``alphashape`` call: its groups are triangulated one
+    after another, and filtered and assembled into polygons together.
+
+    Args:
+
+      points (list or ``numpy.ndarray`` or ``geopandas.GeoDataFrame`` or \
+          ``geopandas.GeoSeries``): an iterable container of points
+      group_ids: a sequence of group labels, one per point
+      alpha (float or callable): alpha value, solved for per group when not
+        given
+      workers (int): maximum number of workers in the pool
+      executor (str): ``'thread'`` or ``'process'``, the kind of pool
+      parallel_threshold (int): the number of points from which a group is
+        sent to the pool on its own, and the size of the batches of the
+        smaller groups
+
+    Returns:
+
+      ``geopandas.GeoSeries`` or ``numpy.ndarray``: the alpha shape of every
+          group, ordered by sorted group label.  A ``GeoSeries`` indexed by
+          group label is returned for two dimensional points when geopandas
+          is installed, and an object array otherwise.
+    """
+    # Extract the coordinates once
+    crs = None
+    geopandas = _loaded_module('geopandas')
+    if geopandas is not None and isinstance(points, geopandas.GeoDataFrame):
+        crs = points.crs
+        points = points['geometry']
+    elif geopandas is not None and isinstance(points, geopandas.GeoSeries):
+        crs = points.crs
+    coords = _coordinates(points)
+    group_ids = np.asarray(group_ids)
+    if len(group_ids) != len(coords):
+        raise ValueError('Expected one group label per point')
+
+    # Sort the points by group so that every group is a contiguous slice
+    labels, inverse = np.unique(group_ids, return_inverse=True)
+    order = np.argsort(inverse, kind='stable')
+    coords, inverse = coords[order], inverse[order]
+    counts = np.bincount(inverse, minlength=len(labels))
+    offsets = np.concatenate(([0], np.cumsum(counts)))
+    results = np.empty(len(labels), dtype=object)
+
+    # Convex hulls of the small groups, all in one call
+    if alpha is not None and not callable(alpha) and alpha <= 0:
+        small = np.ones(len(labels), dtype=bool)
+    else:
+        small = counts < 4
+    if small.any():
+        selected = small[inverse]
+        _, compact = np.unique(inverse[selected], return_inverse=True)
+        results[small] = shapely.convex_hull(shapely.multipoints(
+            coords[selected], indices=compact))
+
+    # Split the medium groups into batches of about parallel_threshold points
+    large = np.flatnonzero(~small & (counts >= parallel_threshold))
+    medium = np.flatnonzero(~small & (counts < parallel_threshold))
+    batches = [batch for batch in np.split(medium, np.flatnonzero(np.diff(
+        np.cumsum(counts[medium]) // max(parallel_threshold, 1))) + 1)
+        if len(batch)]
+    if coords.shape[-1] == 2 and USE_SHAPELY2 and alpha is not None and \
+            not callable(alpha):
+        batched = _batched_shapes
+    else:
+        batched = _looped_shapes
+
+    # Compute the batches and the large groups in the pool
+    if executor == 'thread':
+        pool_class = ThreadPoolExecutor
+    elif executor == 'process':
+        pool_class = ProcessPoolExecutor
+    else:
+        raise ValueError(f'Unknown executor: {executor}')
+    with pool_class(max_workers=workers) as pool:
+        futures = [
+            pool.submit(alphashape, coords[offsets[g]:offsets[g + 1]], alpha)
+            for g in large]
+        batch_futures = [
+            pool.submit(batched, np.concatenate([
+                coords[offsets[g]:offsets[g + 1]] for g in batch]),
+                np.concatenate(([0], np.cumsum(counts[batch]))), alpha)
+            for batch in batches]
+        for group, future in zip(large, futures):
+            results[group] = future.result()
+        for batch, future in zip(batches, batch_futures):
+            results[batch] = future.result()
+
+    if coords.shape[-1] == 2:
+        try:
+            import geopandas
+        except ImportError:
+            return results
+        return geopandas.GeoSeries(results, index=labels, crs=crs)
+    return results
@@ -0,0 +1,180 @@
+"""
+A persistent cache of alpha complexes shared between processes.
+"""
+__all__ = ['ComplexCache']
+
+import os
+import uuid
+import shutil
+import hashlib
+import numpy as np
+from typing import Union, Tuple, List
+from .alphashape import _coordinates
+from .alphacomplex import AlphaComplex
+
+#: Bumped whenever the layout of the cached complexes changes.
+_FORMAT = b'alphashape-complex-1'
+
+
+class ComplexCache:
+    """
+    A directory of spilled alpha complexes, keyed by their points.
+
+    Every complex is stored in a subdirectory named after a hash of the
+    coordinate buffer and the radius type, with the simplices, neighbors,
+    radii and sorted filtration as memory mapped ``.npy`` files, see
+    ``AlphaComplex.load``.  Complexes are created under a temporary name
+    and renamed into place, so processes sharing the cache never see one
+    half written; when two processes build the same complex, the first
+    rename wins.
+
+    When the cache outgrows its size bound, the least recently used
+    complexes are removed.  Their access times are kept as the modification
+    times of their subdirectories.
+
+    Args:
+      directory: the directory of the cache, created if needed
+      max_bytes: the size the cache is trimmed to after every new complex,
+        unbounded when not given
+
+    Attributes:
+      hits: The number of complexes this instance found in the cache.
+      misses: The number of complexes this instance had to create.
+      evictions: The number of complexes this instance removed.
+    """
+
+    def __init__(self, directory: str, max_bytes: Union[None, int] = None):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def __repr__(self) -> str:
+        return '<ComplexCache: %s, %d hits, %d misses, %d evictions>' % (
+            self.directory, self.hits, self.misses, self.evictions)
+
+    @staticmethod
+    def key(points: Union[List[Tuple[float]], np.ndarray],
+            dtype: type = np.float64) -> str:
+        """
+        The key of the complex of a set of points.
+
+        Args:
+          points: an iterable container of points
+          dtype: the floating point type of the radii
+
+        Returns:
+          The hexadecimal hash of the coordinates and the radius type.
+        """
+        coords = _coordinates(points)
+        digest = hashlib.blake2b(_FORMAT, digest_size=20)
+        digest.update(np.dtype(dtype).str.encode())
+        digest.update(np.asarray(coords.shape, dtype=np.int64).tobytes())
+        digest.update(coords)
+        return digest.hexdigest()
+
+    def get(self, points: Union[List[Tuple[float]], np.ndarray],
+            dtype: type = np.float64) -> AlphaComplex:
+        """
+        Open the complex of a set of points, creating it on a miss.
+
+        Args:
+          points: an iterable container of points
+          dtype: the floating point type of the radii
+
+        Returns:
+          The memory mapped ``AlphaComplex``.  Its ``stats`` count the hit
+          or miss as ``cache_hits`` or ``cache_misses``, and include the
+          triangulation and radii on a miss.
+        """
+        coords = _coordinates(points)
+        path = os.path.join(self.directory, self.key(coords, dtype))
+        if os.path.isdir(path):
+            try:
+                os.utime(path)
+                complex_ = AlphaComplex.load(path)
+            except FileNotFoundError:
+                # Evicted by another process meanwhile
+                pass
+            else:
+                self.hits += 1
+                complex_.stats.counts['cache_hits'] = 1
+                return complex_
+
+        # Build the complex under a name of its own and publish it
+        self.misses += 1
+        staging = os.path.join(self.directory, '.%s.tmp' % uuid.uuid4().hex)
+        built = AlphaComplex(coords, dtype, staging)
+        np.save(os.path.join(staging, 'filtration.npy'), built.filtration())
+        stats = built.stats
+        del built
+        try:
+            os.rename(staging, path)
+        except OSError:
+            # Another process published the same complex first
+            shutil.rmtree(staging, ignore_errors=True)
+        complex_ = AlphaComplex.load(path)
+        complex_.stats = stats
+        complex_.stats.counts['cache_misses'] = 1
+        if self.max_bytes is not None:
+            self.trim(self.max_bytes, keep=path)
+        return complex_
+
+    def entries(self) -> List[Tuple[str, float, int]]:
+        """
+        List the complexes in the cache.
+
+        Returns:
+          A list of the path, last access time and size in bytes of every
+          complex, least recently used first.
+        """
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.startswith('.') or not entry.is_dir():
+                continue
+            try:
+                size = sum(item.stat().st_size
+                           for item in os.scandir(entry.path))
+                entries.append((entry.path, entry.stat().st_mtime, size))
+            except FileNotFoundError:
+                # Evicted by another process meanwhile
+                continue
+        return sorted(entries, key=lambda entry: entry[1])
+
+    def size(self) -> int:
+        """
+        The size of the cache in bytes.
+        """
+        return sum(size for _, _, size in self.entries())
+
+    def trim(self, max_bytes: int, keep: Union[None, str] = None):
+        """
+        Remove the least recently used complexes until the cache fits in a
+        size.
+
+        Processes that have a removed complex open keep reading it until
+        they close it, on the platforms that allow removing open files.
+
+        Args:
+          max_bytes: the size to trim the cache to
+          keep: the path of a complex not to remove, such as the one just
+            created
+        """
+        entries = self.entries()
+        total = sum(size for _, _, size in entries)
+        for path, _, size in entries:
+            if total <= max_bytes:
+                break
+            if path == keep:
+                continue
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+            self.evictions += 1
+
+    def clear(self):
+        """
+        Remove every complex from the cache.
+        """
+        self.trim(0)
@@ -3,12 +3,16 @@
 """Console script for alphashape."""
 import os
 import sys
+import time
+import itertools
 import click
 import click_log
 import logging
+import numpy as np
 import shapely
 import geopandas
 import alphashape
+from alphashape.prefilter import grid_decimate, hull_vertices
 
 
 # Setup Logging
@@ -16,14 +20,118 @@ LOGGER = logging.getLogger(__name__)
 click_log.basic_config(LOGGER)
 
 
+def _batches(source_filename, chunk_size):
+    """
+    Open a source once and iterate over its features in batches.
+
+    The source is read through pyogrio as Arrow record batches when pyarrow
+    is installed, and otherwise through a single fiona iterator.  Without
+    either, it is read whole and split.
+
+    Yields:
+      The coordinate reference system of the source, and an object array of
+      the geometries of at most `chunk_size` features.
+    """
+    try:
+        import pyarrow  # noqa: F401
+        import pyogrio
+    except ImportError:
+        pyogrio = None
+    if pyogrio is not None:
+        with pyogrio.open_arrow(source_filename, columns=[], use_pyarrow=True,
+                                batch_size=chunk_size) as (meta, reader):
+            name = meta['geometry_name'] or 'wkb_geometry'
+            for batch in reader:
+                yield meta['crs'], shapely.from_wkb(
+                    batch.column(name).to_numpy(zero_copy_only=False))
+        return
+
+    try:
+        import fiona
+    except ImportError:
+        LOGGER.warning('Streaming requires pyarrow or fiona, reading the '
+                       'source whole')
+        gdf = geopandas.read_file(source_filename)
+        geometries = np.asarray(gdf.geometry.values)
+        for start in range(0, len(geometries), chunk_size):
+            yield gdf.crs, geometries[start:start + chunk_size]
+        return
+    with fiona.open(source_filename) as source:
+        features = iter(source)
+        while True:
+            batch = list(itertools.islice(features, chunk_size))
+            if not batch:
+                break
+            yield source.crs_wkt, np.array([
+                shapely.geometry.shape(feature['geometry'])
+                for feature in batch], dtype=object)
+
+
+def _read_chunks(source_filename, chunk_size, epsg, thin, grid_size):
+    """
+    Read the point coordinates of a source file in chunks of features.
+
+    Only the coordinates of the point features are kept, projected to the
+    given EPSG code if any.  The chunks are collected in a list and joined
+    when thinned, which happens whenever the points gathered since the last
+    thinning outnumber the ones it kept, so every point is copied a bounded
+    number of times.
+
+    Returns:
+      The coordinates, and the coordinate reference system of the source.
+    """
+    chunks = []
+    num_thinned = num_gathered = 0
+    source_crs = None
+    num_read = 0
+    start_time = time.perf_counter()
+    for source_crs, geometries in _batches(source_filename, chunk_size):
+        num_read += len(geometries)
+        points = geometries[shapely.get_type_id(geometries) == 0]
+        if epsg and len(points):
+            points = np.asarray(geopandas.GeoSeries(
+                points, crs=source_crs).to_crs(epsg=epsg).values)
+        chunks.append(shapely.get_coordinates(points))
+        num_gathered += len(chunks[-1])
+        if thin != 'none' and num_gathered >= max(num_thinned, chunk_size):
+            chunks = [_thin(np.concatenate(chunks), thin, grid_size)]
+            num_thinned, num_gathered = len(chunks[0]), 0
+        elapsed = time.perf_counter() - start_time
+        LOGGER.info('Read %d features in %.2f s (%.0f features/s), '
+                    'keeping %d points', num_read, elapsed,
+                    num_read / elapsed if elapsed else 0.,
+                    num_thinned + num_gathered)
+    coords = np.concatenate(chunks) if chunks else np.empty((0, 2))
+    if thin != 'none' and num_gathered:
+        coords = _thin(coords, thin, grid_size)
+    return coords, source_crs
+
+
+def _thin(coords, thin, grid_size):
+    """
+    Thin point coordinates to the vertices of their convex hull or to one
+    point per grid cell.
+    """
+    if thin == 'hull':
+        return hull_vertices(coords)
+    return grid_decimate(coords, grid_size)
+
+
 @click.command()
 @click.argument('source', type=click.Path(exists=True))
 @click.argument('target', type=click.Path())
 @click.option('--alpha', '-a', type=float, help='Alpha parameter')
 @click.option('--epsg', '-e', type=int,
               help='EPSG code to create alpha shape in')
+@click.option('--chunk-size', '-c', type=click.IntRange(min=1),
+              help='Stream the source in chunks of this many features')
+@click.option('--thin', type=click.Choice(['none', 'grid', 'hull']),
+              default='none', show_default=True,
+              help='Thin the points while streaming')
+@click.option('--grid-size', '-g', type=float,
+              help='Grid cell size for grid thinning')
 @click_log.simple_verbosity_option()
-def main(source, target, alpha, epsg):
+def main(source, target, alpha, epsg, chunk_size, thin, grid_size):
     """
     Example console appication using the alphashape toolbox.
 
@@ -44,7 +152,29 @@ def main(source, target, alpha, epsg):
 
     The output file format will be determined by the extension of the provided
     target filename and can be written out in shapefile format or GeoJSON.
+
+    Sources too large for memory can be streamed with a chunk size, keeping
+    only the point coordinates.  While streaming, the points can be thinned
+    to one per cell of a grid with the given grid size, which approximates
+    the alpha shape to within the cell diagonal, or to the vertices of their
+    convex hull, which is exact for an alpha parameter of zero only.
+
+    The durations and counts of the stages of the alpha shape are logged at
+    the DEBUG verbosity.
     """
+    if thin == 'grid' and not grid_size:
+        LOGGER.error('Grid thinning requires a grid size')
+        return 70
+    if thin == 'hull' and alpha != 0:
+        LOGGER.error('Convex hull thinning requires an alpha parameter of 0')
+        return 70
+    if thin != 'none' and not chunk_size:
+        LOGGER.error('Thinning requires a chunk size')
+        return 70
+    if chunk_size:
+        return _main_chunked(source, target, alpha, epsg, chunk_size, thin,
+                             grid_size)
+
     # Read in source data
     source_filename = click.format_filename(source)
     target_filename = click.format_filename(target)
@@ -75,7 +205,9 @@ def main(source, target, alpha, epsg):
     # Generate the alpha shape
     LOGGER.info('Createing alpha shape')
     try:
-        alpha_shape = alphashape.alphashape(gdf_input, alpha)
+        alpha_shape, stats = alphashape.alphashape(
+            gdf_input, alpha, return_stats=True)
+        stats.log(LOGGER)
     except:  # noqa: E722
         LOGGER.error('Could not generate alpha shape')
         return 40
@@ -102,5 +234,60 @@ def main(source, target, alpha, epsg):
     return 0
 
 
+def _main_chunked(source, target, alpha, epsg, chunk_size, thin, grid_size):
+    """
+    Streaming counterpart of ``main``, reading the source in chunks.
+    """
+    # Read in source data
+    source_filename = click.format_filename(source)
+    LOGGER.info('Streaming source file: %s', source_filename)
+    try:
+        coords, source_crs = _read_chunks(
+            source_filename, chunk_size, epsg, thin, grid_size)
+    except:  # noqa: E722
+        LOGGER.error('Could not read source file')
+        return 10
+
+    # Source data type checking
+    if not len(coords):
+        LOGGER.error('Source file does not contain multipiont features')
+        return 20
+
+    # Generate the alpha shape
+    LOGGER.info('Createing alpha shape from %d points', len(coords))
+    try:
+        result, stats = alphashape.alphashape(
+            coords, alpha, return_stats=True)
+        alpha_shape = geopandas.GeoDataFrame(
+            geometry=[result], crs=f'EPSG:{epsg}' if epsg else source_crs)
+        LOGGER.info('Created alpha shape in %.2f s', stats.total)
+        stats.log(LOGGER)
+    except:  # noqa: E722
+        LOGGER.error('Could not generate alpha shape')
+        return 40
+
+    # Project back to the input coordinate system if an EPSG code was given
+    if epsg:
+        LOGGER.info('Projecting alpha shape data to source projection')
+        try:
+            alpha_shape = alpha_shape.to_crs(source_crs)
+        except:  # noqa: E722
+            LOGGER.error('Could not project alpha shape')
+            return 50
+
+    # Write out the target file
+    target_filename = click.format_filename(target)
+    LOGGER.info('Writing target file: %s', target_filename)
+    try:
+        if os.path.splitext(target)[1].lower() == '.geojson':
+            alpha_shape.to_file(target, driver='GeoJSON')
+        else:
+            alpha_shape.to_file(target)
+    except:  # noqa: E722
+        LOGGER.error('Could not write target file')
+        return 60
+    return 0
+
+
 if __name__ == "__main__":
     sys.exit(main())  # pragma: no cover
@@ -0,0 +1,272 @@
+"""
+Alpha shapes for asyncio code, computed on a reusable pool of workers.
+"""
+__all__ = ['AlphashapeExecutor', 'async_alphashape', 'async_optimizealpha']
+
+import queue
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, \
+    ProcessPoolExecutor
+import numpy as np
+from typing import Union, Tuple, List, Callable
+from .alphashape import alphashape
+from .optimizealpha import optimizealpha
+
+#: Arrays of at least this many bytes reach worker processes through shared
+#: memory rather than pickled.
+_SHARED_BYTES = 1 << 16
+
+_DEFAULT = None
+_DEFAULT_LOCK = threading.Lock()
+
+
+def _attach(name: str):
+    """
+    Open a shared memory block created by another process.
+
+    From Python 3.13, the block is left out of the resource tracker of the
+    worker, which would otherwise unlink it when the worker exits.
+    """
+    from multiprocessing import shared_memory
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+def _call_shared(function: Callable, name: str, shape: Tuple[int],
+                 dtype: str, args: tuple, kwargs: dict):
+    """
+    Call a function on an array held in a shared memory block.
+
+    The array is copied out of the block once, so that the block can be
+    closed whatever the result keeps a reference to.
+    """
+    block = _attach(name)
+    try:
+        coords = np.ndarray(shape, dtype, buffer=block.buf).copy()
+    finally:
+        block.close()
+    return function(coords, *args, **kwargs)
+
+
+class AlphashapeExecutor:
+    """
+    A pool of workers that alpha shapes are submitted to.
+
+    The pool is created on the first submission and reused until it is shut
+    down, so serving a request costs no pool startup.  Thread pools suit
+    most uses, since the triangulation and the array operations release the
+    GIL; process pools also parallelize the remaining Python code.  Arrays
+    of coordinates are passed to worker processes through
+    ``multiprocessing.shared_memory`` rather than pickled, and the blocks
+    are unlinked as soon as their request is done.
+
+    At most `max_pending` requests are queued or running at a time, and
+    submitting more raises ``queue.Full`` at once, which a server can turn
+    into a busy response rather than a growing latency.  Cancelling a
+    request, or the asyncio task awaiting it, removes it from the queue;
+    a request that has already started runs to completion and its result
+    is discarded.
+
+    Args:
+      max_workers: the number of workers, see ``concurrent.futures``
+      executor: ``'thread'`` or ``'process'``, the kind of pool
+      max_pending: the number of requests queued or running at a time,
+        unbounded when not given
+
+    Example::
+
+      executor = AlphashapeExecutor(max_workers=4, max_pending=64)
+
+      async def handle(points):
+          return await executor.shape(points, 2.)
+    """
+
+    def __init__(self, max_workers: Union[None, int] = None,
+                 executor: str = 'thread',
+                 max_pending: Union[None, int] = None):
+        if executor not in ('thread', 'process'):
+            raise ValueError(f'Unknown executor: {executor}')
+        self.max_workers = max_workers
+        self.executor = executor
+        self.max_pending = max_pending
+        self._pool = None
+        self._pending = 0
+        self._futures = set()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return '<AlphashapeExecutor: %s, %d pending>' % (
+            self.executor, self.pending)
+
+    def __enter__(self) -> 'AlphashapeExecutor':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+    @property
+    def pending(self) -> int:
+        """
+        The number of requests queued or running.
+        """
+        return self._pending
+
+    def submit(self, function: Callable,
+               points: Union[List[Tuple[float]], np.ndarray],
+               *args, **kwargs) -> Future:
+        """
+        Submit a function of a set of points to the pool.
+
+        Args:
+          function: the function, such as ``alphashape``, which must be
+            picklable for a process pool
+          points: the points, passed as the first argument
+          args: the other positional arguments
+          kwargs: the keyword arguments
+
+        Returns:
+          The ``concurrent.futures.Future`` of the result.
+
+        Raises:
+          queue.Full: if `max_pending` requests are already pending.
+        """
+        with self._lock:
+            if self.max_pending is not None and \
+                    self._pending >= self.max_pending:
+                raise queue.Full('%d requests are already pending' %
+                                 self.max_pending)
+            if self._pool is None:
+                pool_class = ThreadPoolExecutor if \
+                    self.executor == 'thread' else ProcessPoolExecutor
+                self._pool = pool_class(max_workers=self.max_workers)
+            pool = self._pool
+            self._pending += 1
+
+        block = None
+        try:
+            if self.executor == 'process' and \
+                    isinstance(points, np.ndarray) and \
+                    points.dtype != object and \
+                    points.nbytes >= _SHARED_BYTES:
+                from multiprocessing import shared_memory
+                block = shared_memory.SharedMemory(create=True,
+                                                   size=points.nbytes)
+                np.ndarray(points.shape, points.dtype,
+                           buffer=block.buf)[...] = points
+                future = pool.submit(_call_shared, function, block.name,
+                                     points.shape, points.dtype.str, args,
+                                     kwargs)
+            else:
+                future = pool.submit(function, points, *args, **kwargs)
+        except BaseException:
+            self._release(None, block)
+            raise
+        with self._lock:
+            self._futures.add(future)
+        future.add_done_callback(
+            lambda future: self._release(future, block))
+        return future
+
+    def _release(self, future: Union[None, Future], block):
+        """
+        Forget a finished request and unlink its shared memory.
+        """
+        if block is not None:
+            block.close()
+            block.unlink()
+        with self._lock:
+            self._futures.discard(future)
+            self._pending -= 1
+
+    async def shape(self, points: Union[List[Tuple[float]], np.ndarray],
+                    alpha: Union[None, float] = None, **kwargs):
+        """
+        Compute an alpha shape in the pool, see ``alphashape``.
+
+        Raises:
+          queue.Full: if `max_pending` requests are already pending.
+        """
+        return await asyncio.wrap_future(
+            self.submit(alphashape, points, alpha, **kwargs))
+
+    async def optimize(self, points: Union[List[Tuple[float]], np.ndarray],
+                       **kwargs):
+        """
+        Solve for the alpha value in the pool, see ``optimizealpha``.
+
+        Raises:
+          queue.Full: if `max_pending` requests are already pending.
+        """
+        return await asyncio.wrap_future(
+            self.submit(optimizealpha, points, **kwargs))
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = True):
+        """
+        Shut the pool down; the next submission starts a new one.
+
+        Args:
+          wait: wait for the running requests to finish
+          cancel_futures: cancel the queued requests
+        """
+        with self._lock:
+            pool, self._pool = self._pool, None
+            futures = list(self._futures)
+        if cancel_futures:
+            for future in futures:
+                future.cancel()
+        if pool is not None:
+            pool.shutdown(wait=wait)
+
+
+def _default_executor() -> AlphashapeExecutor:
+    """
+    The thread pool executor shared by the module level functions.
+    """
+    global _DEFAULT
+    with _DEFAULT_LOCK:
+        if _DEFAULT is None:
+            _DEFAULT = AlphashapeExecutor()
+        return _DEFAULT
+
+
+async def async_alphashape(
+        points: Union[List[Tuple[float]], np.ndarray],
+        alpha: Union[None, float] = None,
+        executor: Union[None, AlphashapeExecutor] = None, **kwargs):
+    """
+    Compute an alpha shape without blocking the event loop.
+
+    Args:
+      points: an iterable container of points, see ``alphashape``
+      alpha: the alpha value, see ``alphashape``
+      executor (``AlphashapeExecutor``): the pool to compute the shape in,
+        a shared thread pool when not given
+      kwargs: the other arguments of ``alphashape``
+
+    Returns:
+      The result of ``alphashape``.
+    """
+    executor = executor or _default_executor()
+    return await executor.shape(points, alpha, **kwargs)
+
+
+async def async_optimizealpha(
+        points: Union[List[Tuple[float]], np.ndarray],
+        executor: Union[None, AlphashapeExecutor] = None, **kwargs):
+    """
+    Solve for the alpha value without blocking the event loop.
+
+    Args:
+      points: an iterable container of points, see ``optimizealpha``
+      executor (``AlphashapeExecutor``): the pool to solve in, a shared
+        thread pool when not given
+      kwargs: the other arguments of ``optimizealpha``
+
+    Returns:
+      The result of ``optimizealpha``.
+    """
+    executor = executor or _default_executor()
+    return await executor.optimize(points, **kwargs)
@@ -0,0 +1,147 @@
+"""
+Alpha complexes of growing and sliding point sets.
+"""
+__all__ = ['IncrementalAlphaComplex', 'SlidingAlphaComplex']
+
+import numpy as np
+from scipy.spatial import Delaunay
+from typing import Union, Tuple, List
+from .alphashape import _coordinates, _local_coordinates, _facet_keys, \
+    circumradii
+from .alphacomplex import AlphaComplex
+from .stats import Stats
+
+
+class IncrementalAlphaComplex(AlphaComplex):
+    """
+    An alpha complex that points can be appended to.
+
+    The points are triangulated incrementally by Qhull.  After every batch
+    of points, the circumradii of the simplices that were already part of
+    the triangulation are carried over, and only the simplices created by
+    the batch are measured.  The boundary of the alpha shape is extracted
+    from the updated arrays on demand, as for ``AlphaComplex``.
+
+    The local frame the points are triangulated in is fixed by the initial
+    points.  The durations in ``stats`` add up over all the updates.
+
+    Qhull's incremental insertion is not always faster than triangulating
+    all the points again; ``benchmarks/bench_incremental.py`` compares the
+    latency of a batch update with a full rebuild.
+
+    Args:
+      points (list or ``numpy.ndarray`` or ``geopandas.GeoSeries``): the
+        initial points, at least `K` + 2 of them in general position
+
+    Attributes:
+      num_measured: The number of simplices whose circumradius was computed
+        by the last update.
+    """
+
+    def __init__(self, points: Union[List[Tuple[float]], np.ndarray]):
+        self.stats = Stats()
+        coords = _coordinates(points)
+        self._ids = np.arange(len(coords))
+        self._next_id = len(coords)
+        self._rows = None
+        self._triangulate(coords)
+
+    def _triangulate(self, coords: np.ndarray):
+        self.coords = coords
+        local, self.offset, self.scale = _local_coordinates(coords)
+        with self.stats.stage('triangulation'):
+            self._tri = Delaunay(local, incremental=True)
+        self._update()
+
+    def _update(self):
+        """
+        Refresh the arrays of the complex from the triangulation.
+        """
+        tri = self._tri
+        self.simplices = tri.simplices
+        self.neighbors = tri.neighbors
+        self.coplanar = tri.coplanar
+
+        # Match the simplices to the previous ones by their point ids; the
+        # keys of both sets are packed together so that they compare.
+        rows = np.sort(self._ids[self.simplices], axis=1)
+        radii = np.empty(len(rows))
+        degenerate = np.zeros(len(rows), dtype=bool)
+        known = np.zeros(len(rows), dtype=bool)
+        if self._rows is not None and len(self._rows) and len(rows):
+            keys = _facet_keys(np.concatenate((self._rows, rows)))
+            _, new, old = np.intersect1d(
+                keys[len(self._rows):], keys[:len(self._rows)],
+                assume_unique=True, return_indices=True)
+            known[new] = True
+            radii[new] = self.radii[old]
+            degenerate[new] = self.degenerate[old]
+        with self.stats.stage('radii'):
+            radii[~known], degenerate[~known] = circumradii(
+                tri.points[self.simplices[~known]])
+            radii[~known] *= self.scale
+        self.radii, self.degenerate = radii, degenerate
+        self.stats.counts.update(
+            points=len(self.coords), simplices=len(self.simplices),
+            degenerate=int(np.count_nonzero(self.degenerate)))
+        self.num_measured = int(np.count_nonzero(~known))
+        self._rows = rows
+
+    def add_points(self, points: Union[List[Tuple[float]], np.ndarray]):
+        """
+        Append a batch of points to the complex.
+
+        Args:
+          points: the points to append
+        """
+        coords = _coordinates(points)
+        self._ids = np.concatenate((self._ids, np.arange(
+            self._next_id, self._next_id + len(coords))))
+        self._next_id += len(coords)
+        with self.stats.stage('triangulation'):
+            self._tri.add_points((coords - self.offset) / self.scale)
+        self.coords = np.concatenate((self.coords, coords))
+        self._update()
+
+
+class SlidingAlphaComplex(IncrementalAlphaComplex):
+    """
+    An alpha complex of the most recent points of a stream.
+
+    Batches that keep the complex within its window are added incrementally.
+    Once the window overflows, the oldest points are retired; Qhull cannot
+    remove points, so the remaining points are triangulated again, but the
+    circumradii of every simplex that survives the retirement are still
+    carried over.
+
+    Args:
+      points (list or ``numpy.ndarray`` or ``geopandas.GeoSeries``): the
+        initial points
+      window (int): the maximum number of points kept
+    """
+
+    def __init__(self, points: Union[List[Tuple[float]], np.ndarray],
+                 window: int):
+        if window < 1:
+            raise ValueError('The window must hold at least one point')
+        self.window = window
+        coords = _coordinates(points)[-window:]
+        super().__init__(coords)
+
+    def add_points(self, points: Union[List[Tuple[float]], np.ndarray]):
+        """
+        Append a batch of points, retiring the oldest ones beyond the window.
+
+        Args:
+          points: the points to append
+        """
+        coords = _coordinates(points)
+        if len(self.coords) + len(coords) <= self.window:
+            super().add_points(coords)
+            return
+        self._ids = np.concatenate((self._ids, np.arange(
+            self._next_id, self._next_id + len(coords))))[-self.window:]
+        self._next_id += len(coords)
+        coords = np.concatenate((self.coords, coords))[-self.window:]
+        self._tri.close()
+        self._triangulate(coords)
@@ -0,0 +1,159 @@
+"""
+Compiled kernels for the boundary facets of the accepted simplices.
+
+This module requires numba, and is only imported when the ``numba`` backend
+is selected, see ``boundary_facets``.  Each kernel makes one pass over the
+simplices to size its output and another to fill it, and allocates nothing
+but its output and, without the adjacency, a hash table of the facets.  The
+facets come out in the same order as from the NumPy backend.
+"""
+__all__ = ['adjacent_boundary', 'hashed_boundary']
+
+import numpy as np
+from numba import njit
+
+#: Fibonacci hashing multiplier, 2 ** 64 divided by the golden ratio.
+_GOLDEN = np.uint64(11400714819323198485)
+
+
+@njit(cache=True, nogil=True)
+def adjacent_boundary(simplices: np.ndarray, neighbors: np.ndarray,
+                      mask: np.ndarray):
+    """
+    Find the boundary facets from the adjacency of the simplices.
+
+    Args:
+      simplices: An `S`x(`K`+1) array of vertex indices.
+      neighbors: An `S`x(`K`+1) array of the simplices opposite each vertex,
+        -1 on the convex hull.
+      mask: A length `S` boolean array selecting the simplices.
+
+    Returns:
+      An `M`x`K` array of vertex indices of the boundary facets, and a length
+      `M` array of the simplices they belong to.
+    """
+    num_simplices, num_vertices = simplices.shape
+    count = 0
+    for simplex in range(num_simplices):
+        if mask[simplex]:
+            for vertex in range(num_vertices):
+                neighbor = neighbors[simplex, vertex]
+                if neighbor < 0 or not mask[neighbor]:
+                    count += 1
+
+    facets = np.empty((count, num_vertices - 1), dtype=simplices.dtype)
+    owners = np.empty(count, dtype=np.int64)
+    count = 0
+    for simplex in range(num_simplices):
+        if not mask[simplex]:
+            continue
+        # Facet c of the combinations leaves out vertex K - c
+        for vertex in range(num_vertices - 1, -1, -1):
+            neighbor = neighbors[simplex, vertex]
+            if neighbor < 0 or not mask[neighbor]:
+                column = 0
+                for other in range(num_vertices):
+                    if other != vertex:
+                        facets[count, column] = simplices[simplex, other]
+                        column += 1
+                owners[count] = simplex
+                count += 1
+    return facets, owners
+
+
+@njit(cache=True, nogil=True)
+def _facet_key(simplices: np.ndarray, simplex: int, vertex: int, base: int,
+               buffer: np.ndarray) -> int:
+    """
+    Pack the sorted vertex indices of the facet opposite a vertex.
+    """
+    num_vertices = simplices.shape[1]
+    length = 0
+    for other in range(num_vertices):
+        if other == vertex:
+            continue
+        value = simplices[simplex, other]
+        position = length
+        while position > 0 and buffer[position - 1] > value:
+            buffer[position] = buffer[position - 1]
+            position -= 1
+        buffer[position] = value
+        length += 1
+    key = 0
+    for position in range(length):
+        key = key * base + buffer[position]
+    return key
+
+
+@njit(cache=True, nogil=True)
+def _slot(keys: np.ndarray, key: int, shift: np.uint64) -> int:
+    """
+    Find the slot of a key in an open addressing table, or a free one.
+    """
+    wrap = len(keys) - 1
+    slot = np.int64((np.uint64(key) * _GOLDEN) >> shift)
+    while keys[slot] != -1 and keys[slot] != key:
+        slot = (slot + 1) & wrap
+    return slot
+
+
+@njit(cache=True, nogil=True)
+def hashed_boundary(simplices: np.ndarray, mask: np.ndarray, base: int):
+    """
+    Find the facets that belong to exactly one of the selected simplices by
+    counting them in a hash table.
+
+    Args:
+      simplices: An `S`x(`K`+1) array of vertex indices.
+      mask: A length `S` boolean array selecting the simplices.
+      base: A bound on the vertex indices such that `K` digits of this base
+        fit in 63 bits.
+
+    Returns:
+      An `M`x`K` array of vertex indices of the boundary facets, and a length
+      `M` array of the simplices they belong to.
+    """
+    num_simplices, num_vertices = simplices.shape
+    num_facets = 0
+    for simplex in range(num_simplices):
+        if mask[simplex]:
+            num_facets += num_vertices
+    bits = 1
+    while (1 << bits) < 2 * num_facets:
+        bits += 1
+    shift = np.uint64(64 - bits)
+    keys = np.full(1 << bits, -1, dtype=np.int64)
+    counts = np.zeros(1 << bits, dtype=np.uint8)
+    buffer = np.empty(num_vertices - 1, dtype=simplices.dtype)
+
+    # Count every facet, saturating at two
+    for simplex in range(num_simplices):
+        if mask[simplex]:
+            for vertex in range(num_vertices):
+                key = _facet_key(simplices, simplex, vertex, base, buffer)
+                slot = _slot(keys, key, shift)
+                keys[slot] = key
+                if counts[slot] < 2:
+                    counts[slot] += 1
+    count = 0
+    for slot in range(len(counts)):
+        if counts[slot] == 1:
+            count += 1
+
+    facets = np.empty((count, num_vertices - 1), dtype=simplices.dtype)
+    owners = np.empty(count, dtype=np.int64)
+    count = 0
+    for simplex in range(num_simplices):
+        if not mask[simplex]:
+            continue
+        for vertex in range(num_vertices - 1, -1, -1):
+            key = _facet_key(simplices, simplex, vertex, base, buffer)
+            if counts[_slot(keys, key, shift)] == 1:
+                column = 0
+                for other in range(num_vertices):
+                    if other != vertex:
+                        facets[count, column] = simplices[simplex, other]
+                        column += 1
+                owners[count] = simplex
+                count += 1
+    return facets, owners
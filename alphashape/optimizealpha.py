@@ -1,18 +1,18 @@
 __all__ = ['optimizealpha']
 import sys
+import time
 import warnings
 import shapely
 from shapely.geometry import MultiPoint
-from packaging import version
-import trimesh
-from typing import Union, Tuple, List
-import rtree  # Needed by trimesh
+from typing import Union, Tuple, List, Callable
 import numpy as np
-try:
-    import geopandas
-    USE_GP = True
-except ImportError:
-    USE_GP = False
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
+from .alphashape import _coordinates, _loaded_module, _radius_bound, \
+    _filled, USE_SHAPELY2
+from .alphacomplex import AlphaComplex
+from .stats import Stats
+from .cache import ComplexCache
 
 
 def _testalpha(points: Union[List[Tuple[float]], np.ndarray], alpha: float):
@@ -24,7 +24,7 @@ def _testalpha(points: Union[List[Tuple[float]], np.ndarray], alpha: float):
     intersects all the input points.
 
     Args:
-        points: data points
+        points: data points, or an ``AlphaComplex`` built from them
         alpha: alpha value
 
     Returns:
@@ -36,24 +36,226 @@ def _testalpha(points: Union[List[Tuple[float]], np.ndarray], alpha: float):
     except ImportError:
         from .alphashape import alphashape
     polygon = alphashape(points, alpha)
+    if isinstance(points, AlphaComplex):
+        points = points.coords
+    trimesh = _loaded_module('trimesh')
     if isinstance(polygon, shapely.geometry.polygon.Polygon):
-        if not isinstance(points, MultiPoint):
-            # workaround for different versions of shapely
-            if version.parse(shapely.__version__) < version.parse('2.0.0'):
+        # workaround for different versions of shapely
+        if not USE_SHAPELY2:
+            if not isinstance(points, MultiPoint):
                 points = MultiPoint(list(points))
-            else:
-                points = MultiPoint(list(points)).geoms
-        return all([polygon.intersects(point) for point in points])
-    elif isinstance(polygon, trimesh.base.Trimesh):
+            return all([polygon.intersects(point) for point in points])
+        coords = _coordinates(points)
+        shapely.prepare(polygon)
+        return bool(np.all(shapely.intersects_xy(
+            polygon, coords[:, 0], coords[:, 1])))
+    elif trimesh is not None and isinstance(polygon, trimesh.Trimesh):
         return len(polygon.faces) > 0 and all(
-            trimesh.proximity.signed_distance(polygon, list(points)) >= 0)
+            trimesh.proximity.signed_distance(
+                polygon, _coordinates(points)) >= 0)
     else:
         return False
 
 
+def _testcomplex(points: AlphaComplex, alpha: float):
+    """
+    Evaluates an alpha parameter without building any geometry.
+
+    This is the combinatorial equivalent of ``_testalpha``.  The accepted
+    simplices form a single polygon, or a single solid in three and more
+    dimensions, when they are connected through shared facets, and they
+    intersect all the input points when every point is a vertex of an
+    accepted simplex, since no other point of a Delaunay triangulation can
+    lie inside one.  In two dimensions, the rejected triangles enclosed by
+    accepted ones are counted as accepted for both tests, since
+    ``polygonize`` fills them and the polygon covers their vertices.  In
+    three dimensions the geometric check only asks for every point to be
+    inside or on the mesh, and accepts disjoint solids.
+
+    Args:
+        points: an ``AlphaComplex``
+        alpha: alpha value
+
+    Returns:
+        bool: True if the accepted simplices form a single connected region
+            that covers all the input data points.
+    """
+    if len(points) < 4:
+        return _testalpha(points, alpha)
+    accepted = points.accepted(alpha)
+    if not accepted.any():
+        return False
+
+    # In two dimensions, fill the holes enclosed by accepted triangles, as
+    # the polygon covers them
+    if points.coords.shape[-1] == 2:
+        accepted = _filled(points.neighbors, accepted)
+
+    # Every point must be a vertex of an accepted simplex.  Points that were
+    # left out of the triangulation follow the vertex they coincide with.
+    covered = np.zeros(len(points.coords), dtype=bool)
+    covered[points.simplices[accepted]] = True
+    if len(points.coplanar):
+        covered[points.coplanar[:, 0]] = covered[points.coplanar[:, 2]]
+    if not covered.all():
+        return False
+
+    # The accepted simplices must form one component over shared facets
+    index = np.full(len(accepted), -1)
+    index[accepted] = np.arange(np.count_nonzero(accepted))
+    neighbors = points.neighbors[accepted]
+    rows = np.repeat(np.arange(len(neighbors)), neighbors.shape[1])
+    columns = index[neighbors.ravel()]
+    linked = (neighbors.ravel() >= 0) & (columns >= 0)
+    graph = csr_matrix(
+        (np.ones(np.count_nonzero(linked)), (rows[linked], columns[linked])),
+        shape=(len(neighbors), len(neighbors)))
+    return connected_components(graph, directed=False,
+                                return_labels=False) == 1
+
+
+def _critical_alpha(radius: float) -> float:
+    """
+    The largest alpha value whose radius filter accepts a given circumradius.
+
+    Args:
+        radius: a finite, positive circumradius
+
+    Returns:
+        float: the largest alpha for which ``radius < 1.0 / alpha`` holds
+    """
+    radius = float(radius)
+    alpha = 1.0 / radius
+    while not radius < 1.0 / alpha:
+        alpha = np.nextafter(alpha, 0.)
+    return float(alpha)
+
+
+def _expired(deadline: Union[None, float], silent: bool) -> bool:
+    """
+    Check whether the time budget of an optimization is spent.
+
+    Args:
+        deadline: the ``time.perf_counter`` value the budget ends at, or None
+            for no budget
+        silent: silence the warning
+
+    Returns:
+        bool: True once the deadline has passed.
+    """
+    if deadline is None or time.perf_counter() < deadline:
+        return False
+    if not silent:
+        warnings.warn('time budget exhausted while optimizing the alpha '
+                      'parameter, returning the best valid alpha found')
+    return True
+
+
+def _optimizefiltration(points: AlphaComplex, radii: np.ndarray,
+                        lower: float, upper: float, testalpha: Callable,
+                        xtol: float = 0., initial: Union[None, float] = None,
+                        deadline: Union[None, float] = None,
+                        silent: bool = False,
+                        max_iterations: Union[None, int] = None):
+    """
+    Solve for the alpha parameter over the filtration of a complex.
+
+    The alpha shape only changes where 1 / alpha crosses the circumradius of a
+    simplex, so bisecting over the indices of the sorted circumradii visits
+    every distinct shape that the continuous bisection could and needs a
+    number of evaluations logarithmic in the number of simplices.  Given an
+    initial alpha, the search gallops out from its index first, so a
+    solution that moved by `m` indices costs about 2 log2(`m`) evaluations.
+
+    Args:
+        points: an ``AlphaComplex``
+        radii: the filtration of the complex
+        lower: lower limit for optimization
+        upper: upper limit for optimization
+        testalpha: function evaluating an alpha parameter
+        xtol: relative tolerance of the solution
+        initial: alpha value to start the search from
+        deadline: ``time.perf_counter`` value to stop the search at
+        silent: silence warnings
+        max_iterations: maximum number of evaluations, after which the
+            largest alpha found valid so far is returned
+
+    Returns:
+        float: The largest valid alpha parameter, or `lower` if none of the
+            candidates within the limits is valid
+    """
+    with np.errstate(divide='ignore'):
+        radii = radii[(1.0 / radii >= lower) & (1.0 / radii < upper)]
+
+    counter = 0
+
+    def valid(index):
+        nonlocal counter
+        counter += 1
+        return testalpha(points, _critical_alpha(radii[index]))
+
+    def stop():
+        nonlocal silent
+        if max_iterations is not None and counter >= max_iterations:
+            # Warn only once, as the search may stop in two places
+            if not silent:
+                warnings.warn('maximum allowed iterations reached while '
+                              'optimizing the alpha parameter')
+            silent = True
+            return True
+        return _expired(deadline, silent)
+
+    # Shapes only grow as the radius increases, so validity is monotonic
+    # over the indices.  The smallest valid index lies in [low, high], where
+    # high is the smallest index known to be valid, or the length if none.
+    low, high = 0, len(radii)
+    if initial is not None and initial > 0 and len(radii):
+        index = min(int(np.searchsorted(radii, 1.0 / initial)),
+                    len(radii) - 1)
+        step = 1
+        if valid(index):
+            high = index
+            while low < high and not stop():
+                probe = max(high - step, low)
+                if not valid(probe):
+                    low = probe + 1
+                    break
+                high = probe
+                step *= 2
+        else:
+            low = index + 1
+            while low < high and not stop():
+                probe = min(low - 1 + step, high - 1)
+                if valid(probe):
+                    high = probe
+                    break
+                low = probe + 1
+                step *= 2
+
+    # Bisect the remaining bracket
+    while low < high:
+        if high < len(radii) and radii[low] >= (1. - xtol) * radii[high]:
+            break
+        if stop():
+            break
+        middle = (low + high) // 2
+        if valid(middle):
+            high = middle
+        else:
+            low = middle + 1
+    if high == len(radii):
+        return lower
+    return _critical_alpha(radii[high])
+
+
 def optimizealpha(points: Union[List[Tuple[float]], np.ndarray],
                   max_iterations: int = 10000, lower: float = 0.,
-                  upper: float = sys.float_info.max, silent: bool = False):
+                  upper: float = sys.float_info.max, silent: bool = False,
+                  method: str = 'filtration', geometric: bool = False,
+                  return_stats: bool = False,
+                  cache: Union[None, ComplexCache] = None,
+                  xtol: float = 0., time_budget: Union[None, float] = None,
+                  initial: Union[None, float] = None):
     """
     Solve for the alpha parameter.
 
@@ -66,22 +268,55 @@ def optimizealpha(points: Union[List[Tuple[float]], np.ndarray],
 
     Args:
 
-        points: an iterable container of points
+        points: an iterable container of points, or an ``AlphaComplex``
         max_iterations (int): maximum number of iterations while finding the
-            solution
+            solution; the filtration method then returns the largest alpha
+            found valid so far, and the bisection method zero
         lower: lower limit for optimization
         upper: upper limit for optimization
         silent: silence warnings
+        method: ``'filtration'`` to bisect over the sorted circumradii of the
+            Delaunay simplices and return the exact critical alpha, or
+            ``'bisection'`` to bisect over the continuous range of alpha
+            values
+        geometric: evaluate each alpha by building the alpha shape and
+            intersecting it with every point, instead of checking the
+            connectivity and vertex coverage of the accepted simplices;
+            much slower, a closest point query per point in three
+            dimensions and never valid beyond, but useful to validate the
+            combinatorial check
+        return_stats (bool): also return the durations and counts of the
+            triangulation and the optimization, see ``Stats``
+        cache (``ComplexCache``): a cache to take the triangulation, radii
+            and filtration from, and to store them in on a miss
+        xtol: relative tolerance; the search stops once the returned alpha
+            is within this fraction of the largest valid one
+        time_budget: seconds, from the call, after which the search stops
+            and returns the largest valid alpha found so far, with a warning
+        initial: alpha value to start the search from, such as the solution
+            for a previous version of the points; the search expands
+            outwards from it, which is cheap when the solution moved little
 
     Returns:
 
-        float: The optimized alpha parameter
+        float: The optimized alpha parameter, and if requested the ``Stats``
 
     """
+    stats = Stats()
+    deadline = None if time_budget is None else \
+        time.perf_counter() + time_budget
+
     # Convert to a shapely multipoint object if not one already
-    if USE_GP and isinstance(points, geopandas.GeoDataFrame):
+    geopandas = _loaded_module('geopandas')
+    if geopandas is not None and isinstance(points, geopandas.GeoDataFrame):
         points = points['geometry']
 
+    # Triangulate once and reuse the complex for every alpha tested
+    if not isinstance(points, AlphaComplex):
+        points = cache.get(points) if cache is not None else \
+            AlphaComplex(points)
+        stats.update(points.stats)
+
     # Set the bounds
     assert lower >= 0, "The lower bounds must be at least 0"
     # Ensure the upper limit bounds the solution
@@ -89,20 +324,82 @@ def optimizealpha(points: Union[List[Tuple[float]], np.ndarray],
         f'The upper bounds must be less than or equal to {sys.float_info.max} '
         'on your system')
 
-    if _testalpha(points, upper):
-        if not silent:
-            warnings.warn('the max float value does not bound the alpha '
-                          'parameter solution')
-        return 0.
+    # Complexes are checked combinatorially unless asked otherwise
+    if geometric:
+        testalpha = _testalpha
+    else:
+        testalpha = _testcomplex
+
+    # Count the candidates evaluated
+    stats.counts['iterations'] = 0
+
+    def counted(points, alpha):
+        stats.counts['iterations'] += 1
+        return testalpha(points, alpha)
+
+    with stats.stage('optimization'):
+        alpha = _optimize(points, max_iterations, lower, upper, silent,
+                          method, counted, xtol, initial, deadline)
+    return (alpha, stats) if return_stats else alpha
+
+
+def _optimize(points: AlphaComplex, max_iterations: int, lower: float,
+              upper: float, silent: bool, method: str, testalpha: Callable,
+              xtol: float = 0., initial: Union[None, float] = None,
+              deadline: Union[None, float] = None):
+    """
+    Solve for the alpha parameter of a complex, see ``optimizealpha``.
+    """
+    if method not in ('filtration', 'bisection'):
+        raise ValueError(f'Unknown optimization method: {method}')
+
+    # An upper limit that accepts no simplex of four or more points cannot
+    # be valid, and needs no evaluation
+    radii = points.filtration()
+    if len(points) < 4 or not len(radii) or \
+            radii[0] < _radius_bound(upper, radii.dtype):
+        if testalpha(points, upper):
+            if not silent:
+                warnings.warn('the upper limit does not bound the alpha '
+                              'parameter solution')
+            return 0.
+
+    if method == 'filtration':
+        return _optimizefiltration(points, radii, lower, upper, testalpha,
+                                   xtol, initial, deadline, silent,
+                                   max_iterations)
+
+    # Every alpha from twice the inverse of the smallest circumradius on
+    # accepts no simplex
+    if len(points) >= 4 and len(radii):
+        upper = min(upper, 2.0 / float(radii[0]))
+
+    # Expand outwards from the initial alpha to a bracket of the solution
+    if initial is not None and lower < initial < upper:
+        if testalpha(points, initial):
+            lower = initial
+            while lower * 2. < upper and testalpha(points, lower * 2.):
+                lower *= 2.
+            upper = min(upper, lower * 2.)
+        else:
+            upper = initial
+            while upper * .5 > lower and not testalpha(points, upper * .5):
+                upper *= .5
+            lower = max(lower, upper * .5)
 
     # Begin the bisection loop
     counter = 0
-    while (upper - lower) > np.finfo(float).eps * 2:
-        # Bisect the current bounds
+    while (upper - lower) > max(np.finfo(float).eps * 2, xtol * upper):
+        if _expired(deadline, silent):
+            break
+
+        # Bisect the current bounds, until no float lies between them
         test_alpha = (upper + lower) * .5
+        if test_alpha in (lower, upper):
+            break
 
         # Update the bounds to include the solution space
-        if _testalpha(points, test_alpha):
+        if testalpha(points, test_alpha):
             lower = test_alpha
         else:
             upper = test_alpha
@@ -111,8 +408,8 @@ def optimizealpha(points: Union[List[Tuple[float]], np.ndarray],
         counter += 1
         if counter > max_iterations:
             if not silent:
-                warning.warn('maximum allowed iterations reached while '
-                             'optimizing the alpha parameter')
+                warnings.warn('maximum allowed iterations reached while '
+                              'optimizing the alpha parameter')
             lower = 0.
             break
     return lower
@@ -0,0 +1,189 @@
+"""
+Reduce point sets before they are triangulated.
+"""
+__all__ = ['grid_decimate', 'hull_vertices', 'unique_points', 'thin_interior',
+           'prefilter_points']
+
+import numpy as np
+from typing import Union, Sequence
+from scipy.spatial import ConvexHull, QhullError
+
+#: The prefilters in the order they are applied.
+PREFILTERS = ('duplicates', 'grid', 'interior')
+
+#: The diagonal of the cells of the grid prefilter, relative to 1 / alpha.
+_GRID_FRACTION = 0.1
+
+
+def grid_decimate(coords: np.ndarray, cell_size: float) -> np.ndarray:
+    """
+    Keep one point per occupied cell of a regular grid.
+
+    The grid is anchored at the origin, so decimating a set of points in
+    several batches keeps the same cells, and decimating the union of two
+    decimated sets again gives the same cells as decimating all the points.
+
+    Args:
+      coords: An `N`x`K` array of coordinates.
+      cell_size: The edge length of the grid cells.
+
+    Returns:
+      An `M`x`K` array holding the first point of every occupied cell, in
+      input order.
+    """
+    if cell_size <= 0:
+        raise ValueError('The grid cell size must be positive')
+    cells = np.floor(coords / cell_size).astype(np.int64)
+    _, first = np.unique(cells, axis=0, return_index=True)
+    return coords[np.sort(first)]
+
+
+def hull_vertices(coords: np.ndarray) -> np.ndarray:
+    """
+    Keep the points on the convex hull.
+
+    Only the convex hull, an alpha shape with an alpha of zero, is unchanged
+    by this reduction; every other alpha shape depends on the interior
+    points as well.
+
+    Args:
+      coords: An `N`x`K` array of coordinates.
+
+    Returns:
+      An `M`x`K` array of the convex hull vertices, in input order, or all
+      the points when they do not span `K` dimensions.
+    """
+    if len(coords) <= coords.shape[-1] + 1:
+        return coords
+    try:
+        return coords[np.sort(ConvexHull(coords).vertices)]
+    except QhullError:
+        return coords
+
+
+def unique_points(coords: np.ndarray) -> np.ndarray:
+    """
+    Drop exact duplicates of points.
+
+    Qhull drops repeated points from the triangulation itself, so this
+    reduction leaves every alpha shape unchanged.
+
+    Args:
+      coords: An `N`x`K` array of coordinates.
+
+    Returns:
+      An `M`x`K` array holding the first occurrence of every point, in input
+      order.
+    """
+    _, first = np.unique(coords, axis=0, return_index=True)
+    if len(first) == len(coords):
+        return coords
+    return coords[np.sort(first)]
+
+
+def thin_interior(coords: np.ndarray, alpha: float) -> np.ndarray:
+    """
+    Keep one point per grid cell deep inside the point set.
+
+    The grid cells have an edge length of 1 / (2 `alpha` sqrt(`K`)), so the
+    diagonal of a cell is half the radius 1 / `alpha`.  A cell is interior
+    when every cell within ceil(sqrt(`K`)) cells of it along each axis
+    holds a point, and of the points of an interior cell only the first is
+    kept; the points of all the other cells are kept.
+
+    Any ball of radius 1 / `alpha` or more that is empty of the kept points
+    then contains a smaller ball of half that radius around each removed
+    point it would cover, which holds a whole occupied cell and so a kept
+    point.  The empty balls of radius 1 / `alpha` are therefore the same for
+    the kept points as for all of them, and the alpha shape of the kept
+    points covers the same region, bounded by the same points, as the
+    alpha shape of all the points.
+
+    Args:
+      coords: An `N`x`K` array of coordinates.
+      alpha: The alpha value of the shape, which must be positive.
+
+    Returns:
+      An `M`x`K` array of the kept points, in input order.  All the points
+      are kept when the grid cannot be indexed with 64 bit integers.
+    """
+    num_points, num_dims = coords.shape
+    if alpha <= 0:
+        raise ValueError('Interior thinning requires a positive alpha value')
+    margin = int(np.ceil(np.sqrt(num_dims)))
+    cells = np.floor(coords * (2. * alpha * np.sqrt(num_dims)))
+    if not num_points or not np.all(np.isfinite(cells)):
+        return coords
+
+    # Pack the cells into one key each, padded so that the neighbors of
+    # every occupied cell stay on the grid
+    cells -= cells.min(axis=0) - margin
+    sizes = cells.max(axis=0) + margin + 1
+    if np.sum(np.log2(sizes)) >= 63:
+        return coords
+    strides = np.cumprod(np.concatenate((
+        [1.], sizes[:0:-1])))[::-1].astype(np.int64)
+    keys = cells.astype(np.int64) @ strides
+    occupied, first, inverse = np.unique(
+        keys, return_index=True, return_inverse=True)
+
+    # Erode the occupied cells by a box, one axis at a time
+    interior = np.ones(len(occupied), dtype=bool)
+    for stride in strides:
+        survivors = occupied[interior]
+        if not len(survivors):
+            break
+        eroded = interior.copy()
+        for offset in range(-margin, margin + 1):
+            if offset:
+                neighbors = occupied + offset * stride
+                found = np.minimum(np.searchsorted(survivors, neighbors),
+                                   len(survivors) - 1)
+                eroded &= survivors[found] == neighbors
+        interior = eroded
+
+    keep = ~interior[inverse.ravel()]
+    keep[first[interior]] = True
+    return coords[keep]
+
+
+def prefilter_points(coords: np.ndarray, alpha: Union[None, float],
+                     methods: Union[str, Sequence[str]]) -> np.ndarray:
+    """
+    Reduce the points of an alpha shape before they are triangulated.
+
+    The methods are applied in the order of ``PREFILTERS``, whatever their
+    order in `methods`:
+
+    * ``'duplicates'`` drops exact duplicates, see ``unique_points``; exact.
+    * ``'grid'`` keeps one point per cell of a grid whose cell diagonal is a
+      tenth of 1 / `alpha`, see ``grid_decimate``; the shape moves by up to
+      a cell diagonal.
+    * ``'interior'`` keeps one point per grid cell deep inside the point
+      set, see ``thin_interior``; exact.
+
+    Args:
+      coords: An `N`x`K` array of coordinates.
+      alpha: The alpha value of the shape; only ``'duplicates'`` does without
+        a positive one.
+      methods: A prefilter name, or a sequence of them.
+
+    Returns:
+      An `M`x`K` array of the kept points, in input order.
+    """
+    methods = {methods} if isinstance(methods, str) else set(methods)
+    unknown = methods.difference(PREFILTERS)
+    if unknown:
+        raise ValueError('Unknown prefilters: %s' % ', '.join(sorted(unknown)))
+    if methods - {'duplicates'} and (
+            alpha is None or callable(alpha) or alpha <= 0):
+        raise ValueError('Grid and interior prefilters require a constant, '
+                         'positive alpha value')
+    if 'duplicates' in methods:
+        coords = unique_points(coords)
+    if 'grid' in methods:
+        coords = grid_decimate(coords, _GRID_FRACTION / (
+            alpha * np.sqrt(coords.shape[-1])))
+    if 'interior' in methods:
+        coords = thin_interior(coords, alpha)
+    return coords
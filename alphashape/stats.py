@@ -0,0 +1,107 @@
+"""
+Timing and counting of the stages of an alpha shape.
+"""
+__all__ = ['Stats']
+
+import time
+import logging
+import contextlib
+
+
+class Stats:
+    """
+    Durations and counts of the stages of an alpha shape computation.
+
+    ``alphashape`` and ``optimizealpha`` fill an instance when called with
+    ``return_stats=True``, and ``AlphaComplex`` keeps the one of its
+    triangulation.  The stages are, in order of execution:
+
+    ``prefilter``
+      the reduction of the points before their triangulation
+    ``triangulation``
+      the Delaunay triangulation of the points
+    ``radii``
+      the circumradii of the simplices
+    ``tiling``
+      the triangulation and radius filter of every tile of a tiled shape
+    ``optimization``
+      solving for the alpha parameter
+    ``sorting``
+      sorting the circumradii of a sweep over several alpha values
+    ``filtering``
+      the radius filter
+    ``boundary``
+      the extraction of the perimeter facets
+    ``polygons``
+      the assembly of the two dimensional polygons
+    ``mesh``
+      the construction of the three dimensional mesh, with its faces
+      oriented outwards from their tetrahedra
+
+    The counts are the ``prefiltered`` points dropped before the
+    triangulation, ``points``, ``simplices``, ``degenerate`` simplices,
+    ``accepted`` simplices, perimeter ``facets`` (the edges in two
+    dimensions), ``rings`` of the polygons, and optimizer ``iterations``.
+
+    Attributes:
+      durations: A dict of the seconds spent in each stage, in the order the
+        stages ran.
+      counts: A dict of the counts.
+    """
+
+    def __init__(self):
+        self.durations = {}
+        self.counts = {}
+
+    def __repr__(self) -> str:
+        return '<Stats: %.3f s in %d stages>' % (
+            self.total, len(self.durations))
+
+    @property
+    def total(self) -> float:
+        """
+        The seconds spent in all the stages.
+        """
+        return sum(self.durations.values())
+
+    @contextlib.contextmanager
+    def stage(self, name: str):
+        """
+        Time the body of a ``with`` statement as a stage.
+
+        Repeated stages add up.
+
+        Args:
+          name: the name of the stage
+        """
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.durations[name] = self.durations.get(name, 0.) + \
+                time.perf_counter() - start
+
+    def update(self, other: 'Stats'):
+        """
+        Add the durations and counts of another instance to this one.
+
+        Args:
+          other: the ``Stats`` of a nested computation
+        """
+        for name, duration in other.durations.items():
+            self.durations[name] = self.durations.get(name, 0.) + duration
+        for name, count in other.counts.items():
+            self.counts[name] = self.counts.get(name, 0) + count
+
+    def log(self, logger: logging.Logger, level: int = logging.DEBUG):
+        """
+        Write the durations and counts to a logger, one stage per record.
+
+        Args:
+          logger: the logger to write to
+          level: the level of the records
+        """
+        for name, duration in self.durations.items():
+            logger.log(level, 'Stage %s: %.3f s', name, duration)
+        for name, count in self.counts.items():
+            logger.log(level, 'Count %s: %d', name, count)
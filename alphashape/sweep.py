@@ -0,0 +1,91 @@
+"""
+Alpha shapes of one point set at many alpha values.
+"""
+__all__ = ['alphashape_sweep']
+
+import numpy as np
+from typing import Union, Tuple, List, Sequence
+from .alphashape import alphashape, _geometry, _radius_bound, _loaded_module
+from .alphacomplex import AlphaComplex
+from .cache import ComplexCache
+from .stats import Stats
+
+
+def alphashape_sweep(points: Union[List[Tuple[float]], np.ndarray],
+                     alphas: Sequence[float], dtype: type = np.float64,
+                     cache: Union[None, ComplexCache] = None,
+                     return_stats: bool = False):
+    """
+    Compute the alpha shapes of a set of points for several alpha values.
+
+    Alpha shapes are nested: every simplex accepted for an alpha value is
+    also accepted for all the smaller ones.  The points are triangulated
+    and the circumradii sorted once; the alpha values are then walked from
+    the largest down, and each one only adds the simplices whose radius it
+    newly admits before the boundary and geometry of that level are built.
+
+    Args:
+
+      points (list or ``numpy.ndarray`` or ``geopandas.GeoDataFrame`` or
+          ``AlphaComplex``): an iterable container of points
+      alphas (sequence of float): the alpha values, in any order
+      dtype: the floating point type of the circumradii, see ``alphashape``
+      cache (``ComplexCache``): a cache to take the triangulation and radii
+        from, see ``alphashape``
+      return_stats (bool): also return the durations of the stages, summed
+        over the levels, and the counts of the smallest positive alpha
+        value, see ``Stats``
+
+    Returns:
+
+      list or ``geopandas.GeoDataFrame``: the alpha shape of every alpha
+          value, in the order of `alphas`, see ``alphashape``; a
+          ``GeoDataFrame`` with an ``alpha`` column and one row per alpha
+          value for a ``GeoDataFrame`` input.  If requested, the ``Stats``
+          follow.
+    """
+    stats = Stats()
+    alphas = np.asarray(alphas, dtype=float)
+
+    # If given a geodataframe, extract the geometry
+    geopandas = _loaded_module('geopandas')
+    if geopandas is not None and isinstance(points, geopandas.GeoDataFrame):
+        crs = points.crs
+        points = points['geometry']
+    else:
+        crs = None
+
+    # Triangulate once
+    if isinstance(points, AlphaComplex):
+        complex_ = points
+    else:
+        complex_ = cache.get(points, dtype) if cache is not None else \
+            AlphaComplex(points, dtype)
+        stats.update(complex_.stats)
+    with stats.stage('sorting'):
+        order = np.argsort(complex_.radii, kind='stable')
+        radii = complex_.radii[order]
+
+    # Walk the alpha values from the largest, accepting more simplices
+    accepted = np.zeros(len(radii), dtype=bool)
+    num_accepted = 0
+    results = [None] * len(alphas)
+    for index in np.argsort(-alphas, kind='stable'):
+        alpha = alphas[index]
+        if len(complex_) < 4 or alpha <= 0:
+            # The convex hull
+            results[index] = alphashape(complex_, alpha)
+            continue
+        with stats.stage('filtering'):
+            bound = np.searchsorted(
+                radii, _radius_bound(alpha, radii.dtype), side='left')
+            accepted[order[num_accepted:bound]] = True
+            num_accepted = bound
+        results[index] = _geometry(
+            complex_.coords, complex_.simplices, complex_.neighbors,
+            accepted, stats)
+
+    if crs and complex_.coords.shape[-1] == 2:
+        results = geopandas.GeoDataFrame(
+            {'alpha': alphas}, geometry=results, crs=crs)
+    return (results, stats) if return_stats else results
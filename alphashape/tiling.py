@@ -0,0 +1,116 @@
+"""
+Tiled evaluation of alpha complexes for point sets too large for a single
+triangulation.
+"""
+__all__ = ['tiled_simplices']
+
+import os
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from scipy.spatial import Delaunay, QhullError
+from typing import Union, Sequence
+from .alphashape import _local_coordinates, _radius_bound, circumradii
+
+
+def _tile_simplices(coords: np.ndarray, index: np.ndarray, alpha: float,
+                    lower: np.ndarray, upper: np.ndarray,
+                    dtype: type = np.float64) -> np.ndarray:
+    """
+    Find the accepted simplices owned by one tile.
+
+    Args:
+      coords: The coordinates of the points in the tile and its margin.
+      index: The global indices of those points.
+      alpha: alpha value
+      lower: The lower corner of the tile.
+      upper: The upper corner of the tile.
+      dtype: The floating point type of the circumradii.
+
+    Returns:
+      An array of accepted simplices, in global indices, whose centroid lies
+      in the half open box [`lower`, `upper`).
+    """
+    if len(coords) <= coords.shape[-1]:
+        return np.empty((0, coords.shape[-1] + 1), dtype=index.dtype)
+    local, _, scale = _local_coordinates(coords)
+    try:
+        tri = Delaunay(local)
+    except QhullError:
+        return np.empty((0, coords.shape[-1] + 1), dtype=index.dtype)
+    radii, _ = circumradii(local.astype(dtype, copy=False)[tri.simplices],
+                           dtype)
+    radii *= scale
+    simplices = tri.simplices[radii < _radius_bound(alpha, dtype)]
+    centroids = coords[simplices].mean(axis=1)
+    owned = np.all((centroids >= lower) & (centroids < upper), axis=1)
+    return index[simplices[owned]]
+
+
+def _tile_simplices_star(args):
+    return _tile_simplices(*args)
+
+
+def tiled_simplices(coords: np.ndarray, alpha: float,
+                    tiles: Union[int, Sequence[int]],
+                    processes: Union[None, int] = None,
+                    dtype: type = np.float64) -> np.ndarray:
+    """
+    Find the simplices of an alpha complex tile by tile.
+
+    The bounding box of the points is split into a grid of tiles, and every
+    tile is triangulated together with the points within a margin of 2 /
+    `alpha` around it.  A simplex accepted by the radius filter has its
+    circumsphere within 1 / `alpha` of its centroid, so when its centroid
+    lies in a tile, every point that could invalidate it is part of that
+    tile's triangulation.  Each accepted simplex of the whole point set is
+    therefore found, exactly once, by the tile that holds its centroid, and
+    the result matches triangulating all the points at once for points in
+    general position.
+
+    Args:
+      coords: An `N`x`K` array of coordinates.
+      alpha: alpha value
+      tiles: The number of tiles along every axis, or a sequence of numbers
+        with one entry per axis.
+      processes: The number of worker processes; all the available cores
+        when not given, and no process pool at all for one.
+      dtype: The floating point type of the circumradii.
+
+    Returns:
+      An `S`x(`K`+1) array of vertex indices of the accepted simplices.
+    """
+    coords = np.asarray(coords, dtype=float)
+    num_dims = coords.shape[-1]
+    tiles = np.broadcast_to(np.asarray(tiles, dtype=int), (num_dims,))
+    if np.any(tiles < 1):
+        raise ValueError('The number of tiles must be at least 1')
+    margin = 2.0 / alpha
+
+    # Tile boundaries along every axis; the outer tiles are open ended so
+    # that every centroid is owned by exactly one tile.
+    boundaries = []
+    for axis in range(num_dims):
+        edges = np.linspace(coords[:, axis].min(), coords[:, axis].max(),
+                            tiles[axis] + 1)
+        edges[0], edges[-1] = -np.inf, np.inf
+        boundaries.append(edges)
+
+    def tasks():
+        for cell in itertools.product(*[range(n) for n in tiles]):
+            lower = np.array([boundaries[a][c] for a, c in enumerate(cell)])
+            upper = np.array([boundaries[a][c + 1]
+                              for a, c in enumerate(cell)])
+            index = np.flatnonzero(np.all(
+                (coords >= lower - margin) & (coords < upper + margin),
+                axis=1))
+            yield coords[index], index, alpha, lower, upper, dtype
+
+    if processes is None:
+        processes = os.cpu_count() or 1
+    if processes == 1:
+        results = [_tile_simplices(*task) for task in tasks()]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            results = list(executor.map(_tile_simplices_star, tasks()))
+    return np.concatenate(results)
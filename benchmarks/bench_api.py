@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+
+"""
+End to end benchmarks of ``alphashape``, ``alphashape_sweep``,
+``alphashape_many``, ``optimizealpha``, the ``AlphashapeExecutor`` and the
+command line interface.
+
+These hold the public entry points against a baseline; the cost of the
+individual stages is broken down in ``bench_stages``.
+"""
+
+import os
+import asyncio
+import shutil
+import tempfile
+import geopandas
+import numpy as np
+from click.testing import CliRunner
+from alphashape import alphashape, alphashape_sweep, alphashape_many, \
+    optimizealpha, cli, AlphashapeExecutor
+from .common import DISTRIBUTIONS, alpha_for, surface, uniform
+
+
+#: The largest benchmarked size of the higher dimensional point sets.
+LIMITS = {'surface': 1000000, 'uniform4d': 100000}
+
+
+def _points(distribution, num_points):
+    if distribution == 'surface':
+        return surface(num_points)
+    elif distribution == 'uniform4d':
+        return uniform(num_points, 4)
+    return DISTRIBUTIONS[distribution](num_points)
+
+
+class Alphashape:
+    """Alpha shape with a given alpha value."""
+    params = [[1000, 10000, 100000, 1000000, 10000000],
+              list(DISTRIBUTIONS) + ['surface', 'uniform4d']]
+    param_names = ['points', 'distribution']
+    timeout = 1800
+
+    def setup(self, num_points, distribution):
+        if num_points > LIMITS.get(distribution, num_points):
+            # The triangulation outgrows common memory
+            raise NotImplementedError()
+        self.points = _points(distribution, num_points)
+        self.alpha = alpha_for(num_points, self.points.shape[-1])
+
+    def time_alphashape(self, num_points, distribution):
+        alphashape(self.points, self.alpha)
+
+    def peakmem_alphashape(self, num_points, distribution):
+        alphashape(self.points, self.alpha)
+
+
+class Prefilter:
+    """Alpha shape of dense points, reduced before the triangulation."""
+    params = [[100000, 1000000, 10000000],
+              ['none', 'duplicates', 'interior', 'grid']]
+    param_names = ['points', 'prefilter']
+    timeout = 1800
+
+    def setup(self, num_points, prefilter):
+        # A coarse alpha value, leaving hundreds of points per unit of 1 /
+        # alpha squared as in dense scans
+        self.points = uniform(num_points)
+        self.alpha = 10.
+        self.prefilter = None if prefilter == 'none' else prefilter
+
+    def time_alphashape(self, num_points, prefilter):
+        alphashape(self.points, self.alpha, prefilter=self.prefilter)
+
+    def peakmem_alphashape(self, num_points, prefilter):
+        alphashape(self.points, self.alpha, prefilter=self.prefilter)
+
+
+class AlphashapeSweep:
+    """A family of alpha shapes, swept at once or computed one by one."""
+    params = [[1000, 10000, 100000, 1000000], [4, 16]]
+    param_names = ['points', 'levels']
+    timeout = 1800
+
+    def setup(self, num_points, levels):
+        self.points = uniform(num_points)
+        self.alphas = alpha_for(num_points) * np.geomspace(0.25, 4., levels)
+
+    def time_sweep(self, num_points, levels):
+        alphashape_sweep(self.points, self.alphas)
+
+    def time_one_by_one(self, num_points, levels):
+        for alpha in self.alphas:
+            alphashape(self.points, alpha)
+
+
+class AlphashapeMany:
+    """Alpha shapes of many small groups, batched or computed one by one."""
+    params = [[1000, 10000, 100000], [20, 200]]
+    param_names = ['groups', 'size']
+    timeout = 1800
+
+    def setup(self, num_groups, size):
+        if num_groups * size > 2000000:
+            raise NotImplementedError()
+        self.points = uniform(num_groups * size)
+        self.group_ids = np.repeat(np.arange(num_groups), size)
+        self.groups = np.split(self.points, num_groups)
+        self.alpha = alpha_for(size)
+
+    def time_many(self, num_groups, size):
+        alphashape_many(self.points, self.group_ids, self.alpha)
+
+    def time_many_processes(self, num_groups, size):
+        alphashape_many(self.points, self.group_ids, self.alpha,
+                        executor='process')
+
+    def time_one_by_one(self, num_groups, size):
+        for points in self.groups:
+            alphashape(points, self.alpha)
+
+
+class Executor:
+    """Concurrent requests served from asyncio by a reused pool."""
+    params = [[1000, 100000], ['thread', 'process']]
+    param_names = ['points', 'executor']
+    timeout = 1800
+
+    def setup(self, num_points, executor):
+        self.points = [uniform(num_points, seed=seed) for seed in range(16)]
+        self.alpha = alpha_for(num_points)
+        self.executor = AlphashapeExecutor(max_workers=4, executor=executor)
+        # Start the workers outside of the timing
+        self.executor.submit(alphashape, self.points[0][:10], 0.).result()
+
+    def teardown(self, num_points, executor):
+        self.executor.shutdown()
+
+    def time_requests(self, num_points, executor):
+        async def serve():
+            await asyncio.gather(*[self.executor.shape(points, self.alpha)
+                                   for points in self.points])
+        asyncio.run(serve())
+
+
+class Optimizealpha:
+    """Solving for the alpha value."""
+    params = [[1000, 10000, 100000, 1000000],
+              list(DISTRIBUTIONS) + ['surface']]
+    param_names = ['points', 'distribution']
+    timeout = 1800
+
+    def setup(self, num_points, distribution):
+        self.points = _points(distribution, num_points)
+
+    def time_optimizealpha(self, num_points, distribution):
+        optimizealpha(self.points, silent=True)
+
+    def peakmem_optimizealpha(self, num_points, distribution):
+        optimizealpha(self.points, silent=True)
+
+
+class CommandLine:
+    """The command line interface on a GeoJSON file, read whole or streamed."""
+    params = [[1000, 10000, 100000], [None, 10000]]
+    param_names = ['points', 'chunk_size']
+    timeout = 1800
+
+    def setup(self, num_points, chunk_size):
+        self.directory = tempfile.mkdtemp()
+        self.source = os.path.join(self.directory, 'points.geojson')
+        self.target = os.path.join(self.directory, 'shape.geojson')
+        points = uniform(num_points)
+        geopandas.GeoDataFrame(geometry=geopandas.points_from_xy(
+            points[:, 0], points[:, 1]), crs='EPSG:4326').to_file(
+                self.source, driver='GeoJSON')
+        self.args = [self.source, self.target,
+                     '--alpha', str(alpha_for(num_points))]
+        if chunk_size:
+            self.args += ['--chunk-size', str(chunk_size)]
+
+    def teardown(self, num_points, chunk_size):
+        shutil.rmtree(self.directory)
+
+    def time_cli(self, num_points, chunk_size):
+        CliRunner().invoke(cli.main, self.args, catch_exceptions=False)
+
+    def peakmem_cli(self, num_points, chunk_size):
+        CliRunner().invoke(cli.main, self.args, catch_exceptions=False)
@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmarks for the import time of the package.
+
+Each benchmark runs in a fresh interpreter, so that the cost of importing the
+dependencies is included; ``timeraw_import_geopandas`` is the reference of
+one optional dependency the package does not import on its own.
+"""
+
+
+def timeraw_import():
+    return 'import alphashape'
+
+
+def timeraw_import_small_shape():
+    return '''
+import alphashape
+alphashape.alphashape([(0., 0.), (0., 1.), (1., 1.), (1., 0.), (.5, .5)], 1.)
+'''
+
+
+def timeraw_import_geopandas():
+    return 'import geopandas'
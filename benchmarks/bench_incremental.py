@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmarks for incremental alpha complexes.
+
+``time_add_points`` is the latency of one batch update, to be compared with
+``time_rebuild``, the cost of building the complex of all the points again.
+A batch update changes the complex, so it is timed once per ``setup``, with
+no warmup, and every sample adds a fresh batch to a complex of the stated
+size.
+"""
+
+from alphashape import AlphaComplex, IncrementalAlphaComplex, \
+    SlidingAlphaComplex
+from .common import uniform
+
+
+class Incremental:
+    """Appending a batch of points to a complex."""
+    params = [[10000, 100000], [100, 1000]]
+    param_names = ['points', 'batch']
+    timeout = 300
+
+    def setup(self, num_points, batch):
+        self.points = uniform(num_points + batch)
+        self.num_points = num_points
+        self.complex = IncrementalAlphaComplex(self.points[:num_points])
+
+    def time_add_points(self, num_points, batch):
+        self.complex.add_points(self.points[num_points:])
+
+    time_add_points.number = 1
+    time_add_points.repeat = 10
+    time_add_points.warmup_time = 0.
+
+    def time_rebuild(self, num_points, batch):
+        AlphaComplex(self.points)
+
+
+class Sliding:
+    """Appending a batch of points to a full window."""
+    params = [[10000, 100000], [100, 1000]]
+    param_names = ['window', 'batch']
+    timeout = 300
+
+    def setup(self, window, batch):
+        self.points = uniform(window + batch)
+        self.complex = SlidingAlphaComplex(self.points[:window], window)
+
+    def time_add_points(self, window, batch):
+        self.complex.add_points(self.points[window:])
+
+    time_add_points.number = 1
+    time_add_points.repeat = 10
+    time_add_points.warmup_time = 0.
+
+    def time_rebuild(self, window, batch):
+        AlphaComplex(self.points[batch:])
@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmarks for the precision of the radius engine.
+
+Comparing ``time_complex`` and ``peakmem_complex`` across the ``dtype``
+parameter gives the effect of single precision circumradii on large inputs.
+"""
+
+import numpy as np
+from alphashape import AlphaComplex
+from .common import uniform
+
+
+class Precision:
+    """Alpha complex with circumradii in single and double precision."""
+    params = [[100000, 1000000], [2, 3], ['float64', 'float32']]
+    param_names = ['points', 'dimensions', 'dtype']
+    timeout = 600
+
+    def setup(self, num_points, num_dims, dtype):
+        # Projected coordinates, far from the origin.
+        self.points = uniform(num_points, num_dims) * 1000. + 500000.
+
+    def time_complex(self, num_points, num_dims, dtype):
+        AlphaComplex(self.points, np.dtype(dtype).type)
+
+    def peakmem_complex(self, num_points, num_dims, dtype):
+        AlphaComplex(self.points, np.dtype(dtype).type)
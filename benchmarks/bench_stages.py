@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmarks for the stages of an alpha shape.
+
+Each stage is timed on its own, with the output of the preceding stages
+prepared in ``setup``: the Delaunay triangulation, the circumradii, the radius
+filter, the filling of enclosed regions, the boundary facets, the polygon
+assembly and the alpha optimization.
+
+The boundary facets are also timed with each backend, see
+``boundary_facets``.
+
+The ``peakmem_`` benchmarks report the peak resident memory of the whole
+benchmark process, which includes the preceding stages; ``peakmem_setup``
+gives that baseline, and the memory of a stage is its excess over it.
+"""
+
+from scipy.spatial import Delaunay
+from alphashape import AlphaComplex, boundary_facets, circumradii
+from alphashape.alphashape import _filled, _kernels, _polygons
+from .common import DISTRIBUTIONS, alpha_for, surface, uniform
+
+SIZES = [1000, 10000, 100000, 1000000, 10000000]
+
+
+class Stages2D:
+    """The stages of a two dimensional alpha shape."""
+    params = [SIZES, list(DISTRIBUTIONS)]
+    param_names = ['points', 'distribution']
+    timeout = 1800
+
+    def setup(self, num_points, distribution):
+        self.coords = DISTRIBUTIONS[distribution](num_points)
+        self.alpha = alpha_for(num_points)
+        self.complex = AlphaComplex(self.coords)
+        self.vertices = self.coords[self.complex.simplices]
+        self.accepted = self.complex.accepted(self.alpha)
+        self.filled = _filled(self.complex.neighbors, self.accepted)
+        self.edges, self.owners = boundary_facets(
+            self.complex.simplices, self.filled, return_index=True,
+            neighbors=self.complex.neighbors)
+
+    def peakmem_setup(self, num_points, distribution):
+        pass
+
+    def time_triangulation(self, num_points, distribution):
+        Delaunay(self.coords)
+
+    def peakmem_triangulation(self, num_points, distribution):
+        Delaunay(self.coords)
+
+    def time_radii(self, num_points, distribution):
+        circumradii(self.vertices)
+
+    def peakmem_radii(self, num_points, distribution):
+        circumradii(self.vertices)
+
+    def time_filtering(self, num_points, distribution):
+        self.complex.accepted(self.alpha)
+
+    def time_filling(self, num_points, distribution):
+        _filled(self.complex.neighbors, self.accepted)
+
+    def time_boundary(self, num_points, distribution):
+        boundary_facets(self.complex.simplices, self.filled,
+                        neighbors=self.complex.neighbors)
+
+    def peakmem_boundary(self, num_points, distribution):
+        boundary_facets(self.complex.simplices, self.filled,
+                        neighbors=self.complex.neighbors)
+
+    def time_polygons(self, num_points, distribution):
+        _polygons(self.coords, self.complex.simplices, self.edges,
+                  self.owners)
+
+    def peakmem_polygons(self, num_points, distribution):
+        _polygons(self.coords, self.complex.simplices, self.edges,
+                  self.owners)
+
+    def time_optimization(self, num_points, distribution):
+        self.complex.optimize(silent=True)
+
+    def peakmem_optimization(self, num_points, distribution):
+        self.complex.optimize(silent=True)
+
+
+class StagesND:
+    """The stages of alpha shapes of surface samples and in N dimensions."""
+    params = [SIZES[:4], ['surface', 'uniform3d', 'uniform4d']]
+    param_names = ['points', 'distribution']
+    timeout = 1800
+
+    def setup(self, num_points, distribution):
+        if distribution == 'uniform4d' and num_points > 100000:
+            # The four dimensional triangulation outgrows common memory
+            raise NotImplementedError()
+        if distribution == 'surface':
+            self.coords = surface(num_points)
+        else:
+            self.coords = uniform(num_points, int(distribution[-2]))
+        self.alpha = alpha_for(num_points, self.coords.shape[-1])
+        self.complex = AlphaComplex(self.coords)
+        self.vertices = self.coords[self.complex.simplices]
+        self.accepted = self.complex.accepted(self.alpha)
+
+    def peakmem_setup(self, num_points, distribution):
+        pass
+
+    def time_triangulation(self, num_points, distribution):
+        Delaunay(self.coords)
+
+    def peakmem_triangulation(self, num_points, distribution):
+        Delaunay(self.coords)
+
+    def time_radii(self, num_points, distribution):
+        circumradii(self.vertices)
+
+    def peakmem_radii(self, num_points, distribution):
+        circumradii(self.vertices)
+
+    def time_filtering(self, num_points, distribution):
+        self.complex.accepted(self.alpha)
+
+    def time_boundary(self, num_points, distribution):
+        boundary_facets(self.complex.simplices, self.accepted)
+
+    def peakmem_boundary(self, num_points, distribution):
+        boundary_facets(self.complex.simplices, self.accepted)
+
+    def time_optimization(self, num_points, distribution):
+        self.complex.optimize(silent=True)
+
+
+class Backends:
+    """The boundary facets with the NumPy and the numba backend."""
+    params = [SIZES[:4], ['uniform', 'uniform3d'], ['numpy', 'numba'],
+              [True, False]]
+    param_names = ['points', 'distribution', 'backend', 'adjacency']
+    timeout = 1800
+
+    def setup(self, num_points, distribution, backend, adjacency):
+        try:
+            _kernels(backend)
+        except ImportError:
+            raise NotImplementedError()
+        num_dims = 3 if distribution == 'uniform3d' else 2
+        self.coords = uniform(num_points, num_dims)
+        self.complex = AlphaComplex(self.coords)
+        self.accepted = self.complex.accepted(
+            alpha_for(num_points, num_dims))
+        self.neighbors = self.complex.neighbors if adjacency else None
+        # Compile the kernels outside of the timing
+        self.time_boundary(num_points, distribution, backend, adjacency)
+
+    def time_boundary(self, num_points, distribution, backend, adjacency):
+        boundary_facets(self.complex.simplices, self.accepted,
+                        return_index=True, neighbors=self.neighbors,
+                        backend=backend)
+
+    def peakmem_boundary(self, num_points, distribution, backend, adjacency):
+        boundary_facets(self.complex.simplices, self.accepted,
+                        return_index=True, neighbors=self.neighbors,
+                        backend=backend)
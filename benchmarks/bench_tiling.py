@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmarks for tiled alpha shapes.
+
+Comparing ``time_tiled`` across the ``processes`` parameter gives the speedup
+against core count, and ``peakmem_tiled`` the peak memory of the parent
+process, next to the monolithic baseline.
+"""
+
+from alphashape import alphashape
+from .common import uniform
+
+
+class Monolithic:
+    """Alpha shape of the whole point set in one triangulation."""
+    params = [[100000, 1000000]]
+    param_names = ['points']
+    timeout = 600
+
+    def setup(self, num_points):
+        self.points = uniform(num_points)
+        self.alpha = num_points ** .5 / 4
+
+    def time_alphashape(self, num_points):
+        alphashape(self.points, self.alpha)
+
+    def peakmem_alphashape(self, num_points):
+        alphashape(self.points, self.alpha)
+
+
+class Tiled:
+    """Alpha shape of the point set in a grid of tiles."""
+    params = [[100000, 1000000], [1, 2, 4, 8]]
+    param_names = ['points', 'processes']
+    timeout = 600
+
+    def setup(self, num_points, processes):
+        self.points = uniform(num_points)
+        self.alpha = num_points ** .5 / 4
+
+    def time_tiled(self, num_points, processes):
+        alphashape(self.points, self.alpha, tiles=4, processes=processes)
+
+    def peakmem_tiled(self, num_points, processes):
+        alphashape(self.points, self.alpha, tiles=4, processes=processes)
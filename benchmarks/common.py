@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+
+"""Seeded synthetic point sets shared by the benchmarks."""
+
+import numpy as np
+
+
+def uniform(num_points, num_dims=2, seed=0):
+    """Points drawn uniformly from the unit cube."""
+    return np.random.RandomState(seed).random_sample((num_points, num_dims))
+
+
+def clustered(num_points, num_dims=2, seed=0, num_clusters=16):
+    """Points drawn from Gaussian blobs centered in the unit cube."""
+    rng = np.random.RandomState(seed)
+    centers = rng.random_sample((num_clusters, num_dims))
+    labels = rng.randint(num_clusters, size=num_points)
+    return centers[labels] + rng.normal(scale=.03,
+                                        size=(num_points, num_dims))
+
+
+def ring(num_points, num_dims=2, seed=0):
+    """Points drawn uniformly from an annulus, a shape with a hole."""
+    rng = np.random.RandomState(seed)
+    radius = np.sqrt(rng.uniform(.3 ** 2, .5 ** 2, num_points))
+    angle = rng.uniform(0., 2 * np.pi, num_points)
+    return .5 + np.column_stack((radius * np.cos(angle),
+                                 radius * np.sin(angle)))
+
+
+def surface(num_points, num_dims=3, seed=0):
+    """Points sampled from a thin shell around a sphere."""
+    rng = np.random.RandomState(seed)
+    direction = rng.normal(size=(num_points, num_dims))
+    direction /= np.linalg.norm(direction, axis=1)[:, None]
+    radius = .5 + rng.uniform(-.005, .005, (num_points, 1))
+    return .5 + radius * direction
+
+
+#: The two dimensional generators, by name.
+DISTRIBUTIONS = {'uniform': uniform, 'clustered': clustered, 'ring': ring}
+
+
+def alpha_for(num_points, num_dims=2):
+    """An alpha value that scales with the spacing of uniform points."""
+    return num_points ** (1. / num_dims) / 4
@@ -20,6 +20,8 @@ requirements = ['Click>=6.0',
                 'rtree>=0.9.7',
                 'scipy>=1.0.0']
 
+extra_requirements = {'numba': ['numba>=0.50']}
+
 setup_requirements = [ ]
 
 test_requirements = [ ]
@@ -47,6 +49,7 @@ setup(
         ],
     },
     install_requires=requirements,
+    extras_require=extra_requirements,
     license="MIT license",
     long_description=readme + '\n\n' + history,
     long_description_content_type='text/markdown',
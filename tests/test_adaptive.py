@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for spatially varying alpha parameters."""
+
+
+import unittest
+
+import numpy as np
+from alphashape import alphashape, AlphaComplex, KNNAlpha, vectorized_alpha
+
+
+class TestAdaptive(unittest.TestCase):
+    """Tests for spatially varying alpha parameters."""
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+        rng = np.random.RandomState(0)
+        self.points = np.concatenate((
+            rng.random_sample((400, 2)) * .2,
+            rng.random_sample((100, 2)) * .5 + (.5, .5)))
+
+    def tearDown(self):
+        """Tear down test fixtures, if any."""
+
+    def test_vectorized_alpha_matches_per_simplex_alpha(self):
+        """
+        Given the same alpha function with both calling conventions, the
+        accepted simplices and the alpha shape should be the same.
+        """
+        complex_ = AlphaComplex(self.points)
+        knn = KNNAlpha(self.points)
+
+        def per_simplex(point_indices, circumradius):
+            return knn(point_indices[None, :], np.array([circumradius]))[0]
+
+        np.testing.assert_array_equal(
+            complex_.accepted(knn), complex_.accepted(per_simplex))
+        self.assertTrue(alphashape(self.points, knn).equals(
+            alphashape(self.points, per_simplex)))
+
+    def test_vectorized_alpha_decorator(self):
+        """
+        Given a decorated function returning a constant array, the result
+        should match the constant alpha value.
+        """
+        complex_ = AlphaComplex(self.points)
+
+        @vectorized_alpha
+        def constant(simplices, radii):
+            return np.full(len(simplices), 10.)
+
+        np.testing.assert_array_equal(
+            complex_.accepted(constant), complex_.accepted(10.))
+
+    def test_knn_alpha_adapts_to_density(self):
+        """
+        Given a dense and a sparse cluster, the adaptive alpha should wrap
+        both clusters, where any constant alpha tight enough for the dense
+        cluster drops the sparse one.
+        """
+        knn = KNNAlpha(self.points, k=6, scale=2.)
+        self.assertGreater(knn.spacing[400:].mean(),
+                           knn.spacing[:400].mean() * 2)
+        dense_alpha = 1. / (2. * knn.spacing[:400].mean())
+        self.assertEqual(alphashape(self.points, knn).geom_type,
+                         'MultiPolygon')
+        self.assertGreater(
+            alphashape(self.points, knn).area,
+            alphashape(self.points, dense_alpha).area)
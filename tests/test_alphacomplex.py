@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for `AlphaComplex` class."""
+
+
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+from alphashape import AlphaComplex, alphashape, optimizealpha
+
+alphacomplex_module = sys.modules['alphashape.alphacomplex']
+
+
+class TestAlphaComplex(unittest.TestCase):
+    """Tests for `AlphaComplex` class."""
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+        self.points_2d = [
+            (0., 0.), (0., 1.), (1., 1.), (1., 0.),
+            (0.5, 0.25), (0.5, 0.75), (0.25, 0.5), (0.75, 0.5)]
+
+    def tearDown(self):
+        """Tear down test fixtures, if any."""
+
+    def test_shape_matches_alphashape(self):
+        """
+        Given several alpha values, the shape of the complex should match the
+        alphashape function.
+        """
+        complex_ = AlphaComplex(self.points_2d)
+        for alpha in (0., 1., 2., 3., 3.4):
+            assert complex_.shape(alpha).equals(
+                alphashape(self.points_2d, alpha))
+
+    def test_perimeter_shrinks_with_alpha(self):
+        """
+        Given a large alpha value, no simplex passes the radius filter and the
+        perimeter is empty.
+        """
+        complex_ = AlphaComplex(self.points_2d)
+        self.assertEqual(len(complex_.perimeter(1.)), 4)
+        self.assertEqual(len(complex_.perimeter(3.)), 8)
+        self.assertEqual(complex_.perimeter(100.).shape, (0, 2))
+        self.assertTrue(complex_.accepted(1.).all())
+
+    def test_optimize_matches_optimizealpha(self):
+        """
+        Given the same points, optimizing the complex should match the
+        optimizealpha function.
+        """
+        complex_ = AlphaComplex(self.points_2d)
+        self.assertEqual(complex_.optimize(), optimizealpha(self.points_2d))
+
+    def test_given_three_points_return_the_convex_hull(self):
+        """
+        Given three points, the complex should not triangulate and the shape
+        should be the convex hull.
+        """
+        complex_ = AlphaComplex([(0., 0.), (0., 1.), (1., 0.)])
+        self.assertEqual(len(complex_.simplices), 0)
+        assert complex_.shape(10.).equals(
+            alphashape([(0., 0.), (0., 1.), (1., 0.)], 10.))
+        np.testing.assert_array_equal(complex_.coords[0], (0., 0.))
+
+    def test_large_coordinates_keep_precision(self):
+        """
+        Given points a few millimeters apart at geocentric distances from the
+        origin, the complex should triangulate and measure them as it does
+        near the origin, in the units of the original coordinates.
+        """
+        points = np.array(self.points_2d)
+        shifted = points * 1e-3 + (6.4e6, 6.4e6)
+        complex_ = AlphaComplex(points)
+        shifted_complex = AlphaComplex(shifted)
+        self.assertEqual(len(shifted_complex.simplices),
+                         len(complex_.simplices))
+        self.assertFalse(shifted_complex.degenerate.any())
+        np.testing.assert_allclose(
+            np.sort(shifted_complex.radii) * 1e3, np.sort(complex_.radii),
+            rtol=1e-5)
+        self.assertAlmostEqual(
+            shifted_complex.shape(3e3).area * 1e6,
+            complex_.shape(3.).area, places=5)
+
+    def test_float32_radii(self):
+        """
+        Given the single precision type, the complex should store its radii in
+        half the memory and accept the same simplices.
+        """
+        complex_ = AlphaComplex(self.points_2d)
+        single = AlphaComplex(self.points_2d, np.float32)
+        self.assertEqual(single.radii.dtype, np.float32)
+        self.assertEqual(single.radii.nbytes * 2, complex_.radii.nbytes)
+        np.testing.assert_allclose(single.radii, complex_.radii, rtol=1e-6)
+        for alpha in (0.5, 1., 2., 3.):
+            np.testing.assert_array_equal(
+                single.accepted(alpha), complex_.accepted(alpha))
+
+    def test_spilled_complex_matches_and_loads(self):
+        """
+        Given a directory, the complex should be memory mapped from it, match
+        the complex in memory, and load in the same state.
+        """
+        points = np.random.RandomState(0).random_sample((300, 2))
+        complex_ = AlphaComplex(points)
+        with tempfile.TemporaryDirectory() as directory:
+            spilled = AlphaComplex(points, directory=directory)
+            loaded = AlphaComplex.load(directory)
+            for other in (spilled, loaded):
+                self.assertIsInstance(other.radii, np.memmap)
+                for name in ('coords', 'simplices', 'neighbors', 'radii',
+                             'degenerate', 'offset'):
+                    np.testing.assert_array_equal(
+                        getattr(other, name), getattr(complex_, name))
+                self.assertEqual(other.scale, complex_.scale)
+                self.assertTrue(other.shape(8.).equals(complex_.shape(8.)))
+            del spilled, loaded, other
+
+    def test_radii_are_measured_in_blocks(self):
+        """
+        Given blocks smaller than the triangulation, the radii should be the
+        same as measured at once.
+        """
+        points = np.random.RandomState(1).random_sample((200, 3))
+        complex_ = AlphaComplex(points)
+        with mock.patch.object(alphacomplex_module, '_BLOCK_SIZE', 7):
+            blocked = AlphaComplex(points)
+        np.testing.assert_array_equal(blocked.radii, complex_.radii)
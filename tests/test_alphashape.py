@@ -4,12 +4,27 @@
 """Tests for `alphashape` package."""
 
 
+import os
+import sys
+import subprocess
+import tempfile
 import unittest
+from unittest import mock
 from click.testing import CliRunner
 import itertools
 
+import numpy as np
 import shapely
+from shapely.geometry import MultiLineString
+from shapely.ops import polygonize, unary_union
+from scipy.spatial import Delaunay, ConvexHull
 from alphashape.alphashape import alphashape
+from alphashape.alphashape import circumradius
+from alphashape.alphashape import circumradii
+from alphashape.alphashape import boundary_facets
+from alphashape.alphashape import boundary_mesh
+from alphashape.alphashape import _coordinates
+import geopandas
 from alphashape import cli
 
 
@@ -220,9 +235,213 @@ class TestAlphashape(unittest.TestCase):
            self.assertTrue(any([e in expected for e in itertools.combinations(
                 edge, r=len(edge))]))
 
+    def test_circumradii_matches_circumradius(self):
+        """
+        Given a stack of simplices in 2, 3 and 4 dimensions, the batched
+        circumradii should match the per-simplex circumradius.
+        """
+        rng = np.random.RandomState(0)
+        for dimensions in (2, 3, 4):
+            points = rng.random_sample((50, dimensions))
+            simplices = Delaunay(points).simplices
+            radii, degenerate = circumradii(points[simplices])
+            expected = [circumradius(points[s]) for s in simplices]
+            self.assertFalse(degenerate.any())
+            np.testing.assert_allclose(radii, expected, rtol=1e-6)
+
+    def test_circumradius_of_projected_coordinates(self):
+        """
+        Given a right triangle with centimeter legs at UTM northings, the
+        circumradius should be half its hypotenuse.
+        """
+        triangle = np.array([(0., 0.), (.01, 0.), (0., .01)]) + \
+            (500000., 4000000.)
+        self.assertAlmostEqual(circumradius(triangle), .01 / 2 ** .5, places=9)
+
+    def test_circumradii_flags_degenerate_simplices(self):
+        """
+        Given simplices with collinear or coplanar vertices, circumradii should
+        flag them in the mask and give them an infinite radius.
+        """
+        for simplices in (
+                [[(0., 0.), (1., 1.), (2., 2.)],
+                 [(0., 0.), (1., 0.), (0., 1.)]],
+                [[(0., 0., 0.), (1., 0., 0.), (0., 1., 0.), (1., 1., 0.)],
+                 [(0., 0., 0.), (1., 0., 0.), (0., 1., 0.), (0., 0., 1.)]],
+                [[(0., 0., 0., 0.), (1., 1., 1., 1.), (2., 2., 2., 2.),
+                  (3., 3., 3., 3.), (4., 4., 4., 4.)],
+                 [(0., 0., 0., 0.), (1., 0., 0., 0.), (0., 1., 0., 0.),
+                  (0., 0., 1., 0.), (0., 0., 0., 1.)]]):
+            radii, degenerate = circumradii(simplices)
+            self.assertEqual(list(degenerate), [True, False])
+            self.assertEqual(radii[0], np.inf)
+            self.assertTrue(np.isfinite(radii[1]))
+
+    def test_boundary_facets_of_a_square(self):
+        """
+        Given the two triangles of a square, the shared diagonal should be
+        dropped and the four sides returned in simplex order.
+        """
+        simplices = np.array([(0, 1, 2), (0, 2, 3)])
+        np.testing.assert_array_equal(
+            boundary_facets(simplices), [(0, 1), (1, 2), (0, 3), (2, 3)])
+        np.testing.assert_array_equal(
+            boundary_facets(simplices, np.array([False, True])),
+            [(0, 2), (0, 3), (2, 3)])
+        self.assertEqual(boundary_facets(simplices, np.zeros(2, bool)).shape,
+                         (0, 2))
+
+    def test_boundary_facets_from_neighbors(self):
+        """
+        Given the neighbors of the simplices, the boundary facets should be
+        the same as found by counting, in two to four dimensions.
+        """
+        rng = np.random.RandomState(7)
+        for dimensions in (2, 3, 4):
+            tri = Delaunay(rng.random_sample((100, dimensions)))
+            for mask in (None, rng.random_sample(len(tri.simplices)) < .6):
+                for expected, actual in zip(
+                        boundary_facets(tri.simplices, mask, True),
+                        boundary_facets(tri.simplices, mask, True,
+                                        tri.neighbors)):
+                    np.testing.assert_array_equal(actual, expected)
+
+    def test_boundary_mesh_faces_outward(self):
+        """
+        Given every tetrahedron of a point cloud, the mesh should be the
+        convex hull with outward facing triangles and without the interior
+        vertices, and the alpha shape should use the same mesh.
+        """
+        points = np.random.RandomState(6).random_sample((200, 3))
+        tri = Delaunay(points)
+        vertices, faces = boundary_mesh(points, tri.simplices)
+        hull = ConvexHull(points)
+        np.testing.assert_array_equal(
+            vertices, points[np.sort(hull.vertices)])
+        self.assertEqual(len(faces), len(hull.simplices))
+        triangles = vertices[faces]
+        normals = np.cross(triangles[:, 1] - triangles[:, 0],
+                           triangles[:, 2] - triangles[:, 0])
+        outward = triangles[:, 0] - points.mean(axis=0)
+        self.assertTrue(np.all(np.einsum('ij,ij->i', normals, outward) > 0))
+        result = alphashape(points, .01)
+        np.testing.assert_array_equal(result.vertices, vertices)
+        self.assertTrue(result.is_winding_consistent)
+        self.assertAlmostEqual(result.volume, hull.volume)
+
+    def test_ring_assembly_matches_polygonize(self):
+        """
+        Given clustered points and points on an annulus, the polygons built
+        from the perimeter rings should match polygonizing the perimeter
+        edges.
+        """
+        rng = np.random.RandomState(2)
+        angles = rng.random_sample(400) * 2 * np.pi
+        radii = .5 + .5 * rng.random_sample(400)
+        annulus = np.column_stack(
+            (radii * np.cos(angles), radii * np.sin(angles)))
+        clusters = np.concatenate(
+            [center + .08 * rng.standard_normal((80, 2))
+             for center in rng.random_sample((5, 2))])
+        for points in (annulus, clusters):
+            simplices = Delaunay(points).simplices
+            radii, _ = circumradii(points[simplices])
+            for alpha in (2., 6., 12., 25.):
+                edges = boundary_facets(simplices, radii < 1. / alpha)
+                expected = unary_union(list(polygonize(
+                    MultiLineString(list(points[edges])))))
+                result = alphashape(points, alpha)
+                self.assertTrue(result.is_valid)
+                self.assertTrue(result.equals(expected))
+
+    def test_coordinates_are_extracted_without_copies(self):
+        """
+        Given a contiguous float64 array, the coordinates should be the array
+        itself; given geometries, the same coordinates should be extracted.
+        """
+        points = np.random.RandomState(3).random_sample((20, 3))
+        self.assertIs(_coordinates(points), points)
+        series = geopandas.GeoSeries(geopandas.points_from_xy(
+            points[:, 0], points[:, 1], points[:, 2]))
+        np.testing.assert_array_equal(_coordinates(series), points)
+        np.testing.assert_array_equal(
+            _coordinates(geopandas.GeoDataFrame(geometry=series)), points)
+        np.testing.assert_array_equal(
+            _coordinates(shapely.geometry.MultiPoint(points[:, :2])),
+            points[:, :2])
+
+    def test_given_a_geodataframe_return_a_geodataframe(self):
+        """
+        Given a GeoDataFrame, the alpha shape should match the one of the
+        plain coordinates and keep the coordinate reference system.
+        """
+        points = np.random.RandomState(4).random_sample((200, 2))
+        gdf = geopandas.GeoDataFrame(geometry=geopandas.points_from_xy(
+            points[:, 0], points[:, 1]), crs='EPSG:32633')
+        result = alphashape(gdf, 5.)
+        self.assertEqual(result.crs, gdf.crs)
+        self.assertTrue(result['geometry'][0].equals(alphashape(points, 5.)))
+
+    def test_import_leaves_optional_dependencies_unloaded(self):
+        """
+        Given a fresh interpreter, importing the package should not import
+        the packages that only the geopandas and three dimensional paths and
+        the asyncio executor use.
+        """
+        heavy = ('geopandas', 'trimesh', 'rtree', 'packaging', 'asyncio')
+        loaded = subprocess.run([
+            sys.executable, '-c',
+            'import sys, alphashape; print(*(m for m in %r '
+            'if m in sys.modules))' % (heavy,)],
+            capture_output=True, text=True, check=True).stdout.split()
+        self.assertEqual(loaded, [])
+
     def test_command_line_interface(self):
         """Test the CLI."""
         runner = CliRunner()
         help_result = runner.invoke(cli.main, ['--help'])
         assert help_result.exit_code == 0
         assert 'Show this message and exit.' in help_result.output
+
+    def test_command_line_interface_streaming(self):
+        """
+        Given a chunk size, the CLI should stream the source and write the
+        same alpha shape as reading it at once, with or without a batched
+        reader; grid thinning should keep the result within the grid cell
+        diagonal.
+        """
+        points = np.random.RandomState(5).random_sample((500, 2))
+        gdf = geopandas.GeoDataFrame(geometry=geopandas.points_from_xy(
+            points[:, 0], points[:, 1]), crs='EPSG:4326')
+        runner = CliRunner()
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, 'points.geojson')
+            gdf.to_file(source, driver='GeoJSON')
+            results = {}
+            for name, options in (
+                    ('full', []),
+                    ('streamed', ['--chunk-size', '64']),
+                    ('thinned', ['--chunk-size', '64', '--thin', 'grid',
+                                 '--grid-size', '0.02'])):
+                target = os.path.join(directory, name + '.geojson')
+                result = runner.invoke(
+                    cli.main, [source, target, '--alpha', '5'] + options)
+                assert result.exit_code == 0
+                results[name] = geopandas.read_file(target).geometry[0]
+            # Without a batched reader, the source is read once and split
+            target = os.path.join(directory, 'fallback.geojson')
+            with mock.patch.dict(sys.modules, {'pyarrow': None,
+                                               'fiona': None}):
+                result = runner.invoke(cli.main, [
+                    source, target, '--alpha', '5', '--chunk-size', '64'])
+            assert result.exit_code == 0
+            results['fallback'] = geopandas.read_file(target).geometry[0]
+            result = runner.invoke(cli.main, [
+                source, os.path.join(directory, 'hull.geojson'),
+                '--alpha', '5', '--chunk-size', '64', '--thin', 'hull'],
+                standalone_mode=False)
+            self.assertEqual(result.return_value, 70)
+        self.assertTrue(results['streamed'].equals(results['full']))
+        self.assertTrue(results['fallback'].equals(results['full']))
+        self.assertLess(results['thinned'].hausdorff_distance(
+            results['full']), 0.02 * 2 ** .5 * 2)
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for `alphashape_many` function."""
+
+
+import unittest
+
+import numpy as np
+import geopandas
+from alphashape import alphashape, alphashape_many
+
+
+class TestAlphashapeMany(unittest.TestCase):
+    """Tests for `alphashape_many` function."""
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+        rng = np.random.RandomState(0)
+        sizes = [1, 2, 3, 50, 400, 2000]
+        self.points = rng.random_sample((sum(sizes), 2))
+        self.groups = rng.permutation(np.repeat(
+            ['a', 'b', 'c', 'd', 'e', 'f'], sizes))
+
+    def tearDown(self):
+        """Tear down test fixtures, if any."""
+
+    def test_matches_alphashape_per_group(self):
+        """
+        Given groups of every size, each shape should match calling
+        alphashape on the points of its group, whichever path it took.
+        """
+        for parallel_threshold in (10000, 100):
+            result = alphashape_many(
+                self.points, self.groups, 8.,
+                parallel_threshold=parallel_threshold)
+            self.assertIsInstance(result, geopandas.GeoSeries)
+            self.assertEqual(list(result.index), list('abcdef'))
+            for label, shape in result.items():
+                expected = alphashape(
+                    self.points[self.groups == label], 8.)
+                self.assertTrue(shape.equals(expected))
+
+    def test_batches_match_alphashape_per_group(self):
+        """
+        Given many groups that are batched together, each shape should be
+        the same geometry as calling alphashape on its group, whether it is a
+        polygon, several or none, and with a function as alpha.
+        """
+        rng = np.random.RandomState(2)
+        points = rng.random_sample((60 * 30, 2))
+        groups = np.repeat(np.arange(60), 30)
+        for alpha in (6., 1000.):
+            for executor in ('thread', 'process'):
+                result = alphashape_many(points, groups, alpha,
+                                         executor=executor,
+                                         parallel_threshold=200)
+                for label, shape in result.items():
+                    expected = alphashape(points[groups == label], alpha)
+                    self.assertEqual(shape.wkb, expected.wkb)
+        self.assertEqual(
+            {shape.geom_type for shape in alphashape_many(
+                points, groups, 6.)}, {'Polygon', 'MultiPolygon'})
+        result = alphashape_many(points, groups, lambda simplex, radius: 6.,
+                                 parallel_threshold=200)
+        for label, shape in result.items():
+            self.assertTrue(shape.equals(
+                alphashape(points[groups == label], 6.)))
+
+    def test_zero_alpha_returns_convex_hulls(self):
+        """
+        Given an alpha of zero, every group should be its convex hull.
+        """
+        result = alphashape_many(self.points, self.groups, 0.)
+        for label, shape in result.items():
+            expected = alphashape(self.points[self.groups == label], 0.)
+            self.assertTrue(shape.equals(expected))
+
+    def test_given_3_dimensional_points_return_an_array(self):
+        """
+        Given 3-dimensional points, the shapes should come back as an array
+        in sorted group order.
+        """
+        points = np.random.RandomState(1).random_sample((300, 3))
+        groups = np.repeat([2, 1], 150)
+        result = alphashape_many(points, groups, 2., executor='process',
+                                 parallel_threshold=100)
+        self.assertIsInstance(result, np.ndarray)
+        self.assertEqual(len(result[0].faces),
+                         len(alphashape(points[150:], 2.).faces))
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for `ComplexCache` class."""
+
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+from alphashape import alphashape, optimizealpha, AlphaComplex, ComplexCache
+
+
+class TestComplexCache(unittest.TestCase):
+    """Tests for `ComplexCache` class."""
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+        self.directory = tempfile.TemporaryDirectory()
+        rng = np.random.RandomState(0)
+        self.points = rng.random_sample((300, 2))
+        self.other_points = rng.random_sample((300, 2))
+
+    def tearDown(self):
+        """Tear down test fixtures, if any."""
+        self.directory.cleanup()
+
+    def test_hit_after_miss(self):
+        """
+        Given the same points twice, the second lookup should hit, also from
+        another cache instance, and give the same complex.
+        """
+        cache = ComplexCache(self.directory.name)
+        missed = cache.get(self.points)
+        hit = ComplexCache(self.directory.name).get(self.points.copy())
+        cache.get(self.points)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(missed.stats.counts['cache_misses'], 1)
+        self.assertIn('triangulation', missed.stats.durations)
+        self.assertEqual(hit.stats.counts['cache_hits'], 1)
+        self.assertNotIn('triangulation', hit.stats.durations)
+        complex_ = AlphaComplex(self.points)
+        np.testing.assert_array_equal(hit.radii, complex_.radii)
+        np.testing.assert_array_equal(hit.filtration(),
+                                      complex_.filtration())
+
+    def test_keys_depend_on_points_and_radius_type(self):
+        """
+        Given other points or another radius type, the keys should differ.
+        """
+        key = ComplexCache.key(self.points)
+        self.assertEqual(key, ComplexCache.key(self.points.tolist()))
+        self.assertNotEqual(key, ComplexCache.key(self.other_points))
+        self.assertNotEqual(key, ComplexCache.key(self.points, np.float32))
+        self.assertNotEqual(key, ComplexCache.key(self.points.reshape(
+            -1, 3)))
+
+    def test_alphashape_and_optimizealpha_use_the_cache(self):
+        """
+        Given a cache, alphashape and optimizealpha should give the same
+        results as without, and report the cache hits and misses.
+        """
+        cache = ComplexCache(self.directory.name)
+        alpha, stats = optimizealpha(self.points, cache=cache,
+                                     return_stats=True)
+        self.assertEqual(alpha, optimizealpha(self.points))
+        self.assertEqual(stats.counts['cache_misses'], 1)
+        result, stats = alphashape(self.points, 8., cache=cache,
+                                   return_stats=True)
+        self.assertTrue(result.equals(alphashape(self.points, 8.)))
+        self.assertEqual(stats.counts['cache_hits'], 1)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_least_recently_used_complexes_are_evicted(self):
+        """
+        Given a size bound that fits one complex, the least recently used one
+        should be evicted when another is created.
+        """
+        cache = ComplexCache(self.directory.name)
+        cache.get(self.points)
+        size = cache.size()
+        cache.max_bytes = size
+        cache.get(self.other_points)
+        self.assertEqual(cache.evictions, 1)
+        self.assertEqual(len(cache.entries()), 1)
+        self.assertTrue(os.path.isdir(os.path.join(
+            self.directory.name, ComplexCache.key(self.other_points))))
+        cache.clear()
+        self.assertEqual(cache.size(), 0)
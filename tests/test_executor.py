@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for the `executor` module."""
+
+
+import queue
+import asyncio
+import threading
+import unittest
+
+import numpy as np
+from alphashape import alphashape, optimizealpha, AlphashapeExecutor, \
+    async_alphashape, async_optimizealpha
+
+
+class TestExecutor(unittest.IsolatedAsyncioTestCase):
+    """Tests for the `executor` module."""
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+        rng = np.random.RandomState(0)
+        self.points = [rng.random_sample((size, 2))
+                       for size in (100, 300, 5000)]
+
+    def tearDown(self):
+        """Tear down test fixtures, if any."""
+
+    async def test_concurrent_requests_match(self):
+        """
+        Given concurrent requests, the results should match alphashape and
+        optimizealpha, on the shared pool and on process pools.
+        """
+        results = await asyncio.gather(
+            async_alphashape(self.points[0], 4.),
+            async_optimizealpha(self.points[1]))
+        self.assertTrue(results[0].equals(alphashape(self.points[0], 4.)))
+        self.assertEqual(results[1], optimizealpha(self.points[1]))
+        with AlphashapeExecutor(max_workers=2, executor='process') as \
+                executor:
+            # The largest array passes through shared memory
+            results = await asyncio.gather(*[
+                async_alphashape(points, 8., executor=executor)
+                for points in self.points])
+            for points, result in zip(self.points, results):
+                self.assertTrue(result.equals(alphashape(points, 8.)))
+            self.assertEqual(executor.pending, 0)
+
+    async def test_bounded_queue_and_cancellation(self):
+        """
+        Given a busy pool, requests beyond the bound should be refused, and
+        cancelled requests should leave the queue without running.
+        """
+        with AlphashapeExecutor(max_workers=1, max_pending=2) as executor:
+            release = threading.Event()
+            blocking = executor.submit(release.wait, 10.)
+            queued = asyncio.ensure_future(executor.shape(self.points[0], 4.))
+            await asyncio.sleep(0)
+            self.assertEqual(executor.pending, 2)
+            with self.assertRaises(queue.Full):
+                await executor.shape(self.points[0], 4.)
+            queued.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await queued
+            self.assertEqual(executor.pending, 1)
+            release.set()
+            self.assertTrue(blocking.result())
+            self.assertTrue((await executor.shape(self.points[0], 4.)).equals(
+                alphashape(self.points[0], 4.)))
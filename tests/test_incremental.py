@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for incremental alpha complexes."""
+
+
+import unittest
+
+import numpy as np
+from alphashape import alphashape, AlphaComplex, IncrementalAlphaComplex, \
+    SlidingAlphaComplex
+
+
+class TestIncremental(unittest.TestCase):
+    """Tests for incremental alpha complexes."""
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+        self.points = np.random.RandomState(0).random_sample((3000, 2))
+
+    def tearDown(self):
+        """Tear down test fixtures, if any."""
+
+    def test_add_points_matches_batch_complex(self):
+        """
+        Given points added in batches, the radii and the alpha shape should
+        match a complex built from all the points, and only the new simplices
+        should be measured.
+        """
+        complex_ = IncrementalAlphaComplex(self.points[:2000])
+        for start in (2000, 2500):
+            complex_.add_points(self.points[start:start + 500])
+            self.assertLess(complex_.num_measured, len(complex_.simplices))
+        expected = AlphaComplex(self.points)
+        self.assertEqual(len(complex_), len(self.points))
+        np.testing.assert_allclose(np.sort(complex_.radii),
+                                   np.sort(expected.radii))
+        self.assertTrue(alphashape(complex_, 20.).equals(
+            alphashape(self.points, 20.)))
+
+    def test_sliding_window_retires_old_points(self):
+        """
+        Given more points than the window holds, only the most recent points
+        should remain, and the alpha shape should match them.
+        """
+        complex_ = SlidingAlphaComplex(self.points[:1000], window=1500)
+        complex_.add_points(self.points[1000:1400])
+        self.assertEqual(len(complex_), 1400)
+        complex_.add_points(self.points[1400:2000])
+        self.assertEqual(len(complex_), 1500)
+        np.testing.assert_array_equal(complex_.coords, self.points[500:2000])
+        self.assertLess(complex_.num_measured, len(complex_.simplices))
+        self.assertTrue(alphashape(complex_, 20.).equals(
+            alphashape(self.points[500:2000], 20.)))
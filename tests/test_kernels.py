@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for the `kernels` module."""
+
+
+import sys
+import unittest
+from unittest import mock
+
+import numpy as np
+from alphashape import alphashape, boundary_facets, AlphaComplex
+
+alphashape_module = sys.modules['alphashape.alphashape']
+
+try:
+    import numba  # noqa: F401
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+class TestKernels(unittest.TestCase):
+    """Tests for the `kernels` module."""
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+        rng = np.random.RandomState(0)
+        self.complexes = [AlphaComplex(rng.random_sample((size, dims)))
+                          for size, dims in ((500, 2), (300, 3), (100, 4))]
+
+    def tearDown(self):
+        """Tear down test fixtures, if any."""
+
+    @unittest.skipUnless(HAS_NUMBA, 'requires numba')
+    def test_numba_backend_matches_numpy(self):
+        """
+        Given masked simplices with and without their adjacency, the numba
+        backend should find the same facets, in the same order, as numpy.
+        """
+        for complex_ in self.complexes:
+            for alpha in (1., 4.):
+                accepted = complex_.accepted(alpha)
+                for neighbors in (complex_.neighbors, None):
+                    expected = boundary_facets(
+                        complex_.simplices, accepted, True, neighbors)
+                    result = boundary_facets(
+                        complex_.simplices, accepted, True, neighbors,
+                        backend='numba')
+                    for array, expected_array in zip(result, expected):
+                        np.testing.assert_array_equal(array, expected_array)
+        points = self.complexes[0].coords
+        self.assertTrue(alphashape(points, 4., backend='numba').equals(
+            alphashape(points, 4.)))
+        self.assertTrue(alphashape(points, 4., tiles=2, backend='auto').equals(
+            alphashape(points, 4., tiles=2)))
+
+    @unittest.skipUnless(HAS_NUMBA, 'requires numba')
+    def test_backend_builds_the_polygons(self):
+        """
+        Given a backend and enclosed regions to fill, the two dimensional
+        perimeter should be found once, with that backend.
+        """
+        points = self.complexes[0].coords
+        with mock.patch.object(alphashape_module, 'boundary_facets',
+                               wraps=boundary_facets) as patched:
+            result = alphashape(points, 20., backend='numba')
+        self.assertEqual(
+            [call.kwargs['backend'] for call in patched.call_args_list],
+            ['numba'])
+        self.assertTrue(result.equals(alphashape(points, 20.)))
+
+    def test_unknown_backend(self):
+        """
+        Given an unknown backend, a ValueError should be raised.
+        """
+        with self.assertRaises(ValueError):
+            boundary_facets(self.complexes[0].simplices, backend='cython')
@@ -4,9 +4,14 @@
 """Tests for `alphashape` package."""
 
 
+import sys
 import unittest
+from unittest import mock
 
-from alphashape import optimizealpha
+import numpy as np
+from alphashape import optimizealpha, AlphaComplex
+
+optimizealpha_module = sys.modules['alphashape.optimizealpha']
 
 
 class TestOptimizeAlapha(unittest.TestCase):
@@ -26,3 +31,124 @@ class TestOptimizeAlapha(unittest.TestCase):
             [(0., 0.), (0., 1.), (1., 1.), (1., 0.),
              (0.5, 0.25), (0.5, 0.75), (0.25, 0.5), (0.75, 0.5)])
         assert alpha > 3. and alpha < 3.5
+
+    def test_filtration_returns_the_critical_alpha(self):
+        """
+        Given random points, the filtration solver should return a valid alpha
+        whose next representable value is invalid, with a number of
+        evaluations logarithmic in the number of simplices.
+        """
+        points = np.random.RandomState(0).random_sample((300, 2)) * 10.
+        complex_ = AlphaComplex(points)
+        testalpha = optimizealpha_module._testcomplex
+        with mock.patch.object(optimizealpha_module, '_testcomplex',
+                               wraps=testalpha) as patched:
+            alpha = optimizealpha(complex_)
+        self.assertLessEqual(
+            patched.call_count, np.ceil(np.log2(len(complex_.radii))) + 2)
+        self.assertTrue(testalpha(complex_, alpha))
+        self.assertFalse(testalpha(complex_, np.nextafter(alpha, np.inf)))
+        self.assertAlmostEqual(
+            alpha, optimizealpha(complex_, method='bisection'), places=12)
+
+    def test_combinatorial_check_agrees_with_geometric_check(self):
+        """
+        Given random points with duplicates and holes, the combinatorial check
+        should agree with the geometric check at every alpha of the
+        filtration, and both should solve to the same alpha.
+        """
+        for seed in range(1, 21):
+            points = np.random.RandomState(seed).random_sample((40, 2))
+            complex_ = AlphaComplex(np.vstack((points, points[:5])))
+            for radius in complex_.filtration():
+                alpha = optimizealpha_module._critical_alpha(radius)
+                self.assertEqual(
+                    optimizealpha_module._testcomplex(complex_, alpha),
+                    optimizealpha_module._testalpha(complex_, alpha))
+        points = np.random.RandomState(1).random_sample((100, 2))
+        complex_ = AlphaComplex(np.vstack((points, points[:5])))
+        self.assertEqual(optimizealpha(complex_),
+                         optimizealpha(complex_, geometric=True))
+
+    def test_combinatorial_check_in_three_and_four_dimensions(self):
+        """
+        Given points in three dimensions, the combinatorial check should be
+        used by default and its alpha accepted by the geometric check; in four
+        dimensions, where no geometric check exists, it should still find a
+        critical alpha.
+        """
+        points = np.random.RandomState(2).random_sample((60, 3))
+        complex_ = AlphaComplex(points)
+        with mock.patch.object(optimizealpha_module, '_testalpha') as patched:
+            alpha = optimizealpha(complex_)
+        patched.assert_not_called()
+        self.assertGreater(alpha, 0.)
+        self.assertTrue(optimizealpha_module._testalpha(complex_, alpha))
+        self.assertLessEqual(alpha, optimizealpha(complex_, geometric=True))
+
+        complex_ = AlphaComplex(
+            np.random.RandomState(3).random_sample((40, 4)))
+        alpha = optimizealpha(complex_)
+        self.assertTrue(optimizealpha_module._testcomplex(complex_, alpha))
+        self.assertFalse(optimizealpha_module._testcomplex(
+            complex_, np.nextafter(alpha, np.inf)))
+
+    def test_warm_start_from_a_previous_solution(self):
+        """
+        Given the solution for slightly different points, the search should
+        start from it, return the same alpha as a cold start and need fewer
+        evaluations.
+        """
+        rng = np.random.RandomState(4)
+        points = rng.random_sample((2000, 2))
+        previous = optimizealpha(points)
+        points += rng.normal(scale=1e-4, size=points.shape)
+        complex_ = AlphaComplex(points)
+        cold, cold_stats = optimizealpha(complex_, return_stats=True)
+        for method in ('filtration', 'bisection'):
+            alpha, stats = optimizealpha(complex_, initial=previous,
+                                         method=method, return_stats=True)
+            self.assertAlmostEqual(alpha, cold, places=12)
+        alpha, stats = optimizealpha(complex_, initial=previous,
+                                     return_stats=True)
+        self.assertLess(stats.counts['iterations'],
+                        cold_stats.counts['iterations'])
+
+    def test_tolerance_and_time_budget(self):
+        """
+        Given a relative tolerance, the alpha should be valid and within it of
+        the exact one; given a spent time budget, the best valid alpha found
+        should be returned with a warning.
+        """
+        complex_ = AlphaComplex(
+            np.random.RandomState(5).random_sample((2000, 2)))
+        exact = optimizealpha(complex_)
+        testalpha = optimizealpha_module._testcomplex
+        for method in ('filtration', 'bisection'):
+            alpha = optimizealpha(complex_, xtol=.05, method=method)
+            self.assertTrue(testalpha(complex_, alpha))
+            self.assertLessEqual(alpha, exact)
+            self.assertGreaterEqual(alpha, exact * .95)
+        with self.assertWarns(UserWarning):
+            alpha = optimizealpha(complex_, time_budget=0.,
+                                  initial=exact * .5)
+        self.assertTrue(testalpha(complex_, alpha))
+        self.assertLessEqual(alpha, exact)
+
+    def test_maximum_iterations_of_the_filtration(self):
+        """
+        Given too few iterations, the filtration solver should stop after that
+        many evaluations and return the best valid alpha found, with a warning.
+        """
+        complex_ = AlphaComplex(
+            np.random.RandomState(6).random_sample((500, 2)))
+        exact = optimizealpha(complex_)
+        testalpha = optimizealpha_module._testcomplex
+        with mock.patch.object(optimizealpha_module, '_testcomplex',
+                               wraps=testalpha) as patched:
+            with self.assertWarns(UserWarning):
+                alpha = optimizealpha(complex_, max_iterations=4)
+        self.assertLessEqual(patched.call_count, 5)
+        self.assertGreater(alpha, 0.)
+        self.assertTrue(testalpha(complex_, alpha))
+        self.assertLess(alpha, exact)
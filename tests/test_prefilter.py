@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for the `prefilter` module."""
+
+
+import unittest
+
+import numpy as np
+import geopandas
+from alphashape import alphashape
+from alphashape.prefilter import grid_decimate, hull_vertices, \
+    unique_points, thin_interior, prefilter_points
+
+
+class TestPrefilter(unittest.TestCase):
+    """Tests for the `prefilter` module."""
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+        points = np.random.RandomState(0).random_sample((40000, 2))
+        self.points = points[np.hypot(*(points - .5).T) < .45]
+
+    def tearDown(self):
+        """Tear down test fixtures, if any."""
+
+    def test_unique_points(self):
+        """
+        Given repeated points, the first occurrences should be kept in order.
+        """
+        points = np.array([[1., 0.], [0., 0.], [1., 0.], [0., 1.], [0., 0.]])
+        np.testing.assert_array_equal(unique_points(points), points[[0, 1, 3]])
+
+    def test_grid_decimate_and_hull_vertices(self):
+        """
+        Given a grid size, one point per cell should be kept, and the hull
+        vertices should give the convex hull.
+        """
+        decimated = grid_decimate(self.points, .1)
+        self.assertEqual(len(decimated), len(np.unique(
+            np.floor(self.points / .1), axis=0)))
+        self.assertTrue(alphashape(hull_vertices(self.points), 0.).equals(
+            alphashape(self.points, 0.)))
+
+    def test_thin_interior_keeps_the_shape(self):
+        """
+        Given dense points, interior thinning should drop most of them and
+        leave the alpha shape unchanged, in two and three dimensions.
+        """
+        for alpha in [5., 20., 60.]:
+            thinned = thin_interior(self.points, alpha)
+            self.assertLess(len(thinned), len(self.points))
+            self.assertTrue(alphashape(thinned, alpha).equals(
+                alphashape(self.points, alpha)))
+        points = np.random.RandomState(1).random_sample((20000, 3))
+        thinned = thin_interior(points, 4.)
+        self.assertLess(len(thinned), len(points))
+        expected = alphashape(points, 4.)
+        result = alphashape(thinned, 4.)
+        self.assertAlmostEqual(result.volume, expected.volume)
+        np.testing.assert_array_equal(
+            np.unique(result.vertices[result.faces].reshape(-1, 3), axis=0),
+            np.unique(expected.vertices[expected.faces].reshape(-1, 3),
+                      axis=0))
+
+    def test_alphashape_prefilter(self):
+        """
+        Given prefilters, alphashape should count the dropped points, keep
+        the shape for the exact ones and stay within a cell diagonal for the
+        grid.
+        """
+        points = np.concatenate((self.points, self.points[:100]))
+        expected = alphashape(points, 20.)
+        result, stats = alphashape(points, 20., return_stats=True,
+                                   prefilter=('interior', 'duplicates'))
+        self.assertTrue(result.equals(expected))
+        self.assertGreater(stats.counts['prefiltered'], 100)
+        self.assertIn('prefilter', stats.durations)
+        self.assertEqual(stats.counts['points'], len(points) -
+                         stats.counts['prefiltered'])
+        result = alphashape(points, 20., prefilter='grid')
+        self.assertLess(result.hausdorff_distance(expected), .1 / 20.)
+
+    def test_invalid_prefilters(self):
+        """
+        Given an unknown prefilter, or an alpha dependent one without an
+        alpha value, a ValueError should be raised.
+        """
+        with self.assertRaises(ValueError):
+            prefilter_points(self.points, 1., 'voxels')
+        with self.assertRaises(ValueError):
+            alphashape(self.points, prefilter='interior')
+        self.assertEqual(len(prefilter_points(self.points, None,
+                                              'duplicates')),
+                         len(self.points))
+
+    def test_prefilter_to_fewer_than_four_points(self):
+        """
+        Given points that prefilter to fewer than four, the convex hull should
+        be returned as without the prefilter, also for a GeoDataFrame.
+        """
+        points = [(0., 0.)] * 3 + [(1., 0.)] * 2 + [(0., 1.)]
+        expected = alphashape(points, 1.)
+        self.assertEqual(expected.geom_type, 'Polygon')
+        result, stats = alphashape(points, 1., prefilter='duplicates',
+                                   return_stats=True)
+        self.assertTrue(result.equals(expected))
+        self.assertEqual(stats.counts['prefiltered'], 3)
+        gdf = geopandas.GeoDataFrame(geometry=geopandas.points_from_xy(
+            *zip(*points)), crs='EPSG:32633')
+        result = alphashape(gdf, 1., prefilter='duplicates')
+        self.assertEqual(result.crs, gdf.crs)
+        self.assertTrue(result.geometry[0].equals(expected))
@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for the stage statistics of alpha shapes."""
+
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import geopandas
+from click.testing import CliRunner
+from alphashape import alphashape, optimizealpha, AlphaComplex, Stats, cli
+
+
+class TestStats(unittest.TestCase):
+    """Tests for the stage statistics of alpha shapes."""
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+        self.points = np.random.RandomState(0).random_sample((300, 2))
+
+    def tearDown(self):
+        """Tear down test fixtures, if any."""
+
+    def test_alphashape_reports_stages_and_counts(self):
+        """
+        Given return_stats, alphashape should return the same shape together
+        with the durations of its stages and the counts of its simplices.
+        """
+        result, stats = alphashape(self.points, 5., return_stats=True)
+        self.assertTrue(result.equals(alphashape(self.points, 5.)))
+        self.assertEqual(list(stats.durations), [
+            'triangulation', 'radii', 'filtering', 'boundary', 'polygons'])
+        self.assertTrue(all(d >= 0 for d in stats.durations.values()))
+        complex_ = AlphaComplex(self.points)
+        accepted = complex_.accepted(5.)
+        self.assertEqual(stats.counts['points'], 300)
+        self.assertEqual(stats.counts['simplices'], len(complex_.simplices))
+        self.assertEqual(stats.counts['degenerate'], 0)
+        self.assertEqual(stats.counts['accepted'], accepted.sum())
+        self.assertEqual(stats.counts['facets'],
+                         len(complex_.perimeter(5.)))
+        self.assertEqual(stats.counts['rings'], 1 + len(result.interiors))
+
+    def test_facets_are_the_edges_of_the_polygons(self):
+        """
+        Given enclosed regions that are filled, the facets should count the
+        edges of the resulting polygons rather than the unfilled perimeter.
+        """
+        perimeter = AlphaComplex(self.points).perimeter(15.)
+        result, stats = alphashape(self.points, 15., return_stats=True)
+        edges = sum(len(polygon.exterior.coords) - 1
+                    for polygon in getattr(result, 'geoms', [result]))
+        self.assertEqual(stats.counts['facets'], edges)
+        self.assertLess(stats.counts['facets'], len(perimeter))
+
+    def test_optimizer_iterations(self):
+        """
+        Given a solved alpha parameter, the optimizer iterations should be
+        reported by optimizealpha and included in the alphashape statistics.
+        """
+        alpha, stats = optimizealpha(self.points, return_stats=True)
+        self.assertEqual(alpha, optimizealpha(self.points))
+        num_radii = len(AlphaComplex(self.points).filtration())
+        self.assertGreater(stats.counts['iterations'], 1)
+        self.assertLessEqual(stats.counts['iterations'],
+                             2 + int(np.log2(num_radii)))
+        _, shape_stats = alphashape(self.points, return_stats=True)
+        self.assertIn('optimization', shape_stats.durations)
+        self.assertEqual(shape_stats.counts['iterations'],
+                         stats.counts['iterations'])
+
+    def test_three_dimensional_mesh_stage(self):
+        """
+        Given three dimensional points, the mesh construction should be
+        reported as its own stage.
+        """
+        points = np.random.RandomState(1).random_sample((100, 3))
+        _, stats = alphashape(points, 1., return_stats=True)
+        self.assertEqual(list(stats.durations)[-1], 'mesh')
+        self.assertNotIn('rings', stats.counts)
+
+    def test_stages_add_up(self):
+        """
+        Given repeated stages and nested statistics, the durations and counts
+        should add up.
+        """
+        stats, nested = Stats(), Stats()
+        for _ in range(2):
+            with stats.stage('radii'):
+                pass
+        nested.durations['radii'] = 1.
+        nested.counts['iterations'] = 3
+        stats.update(nested)
+        self.assertEqual(list(stats.durations), ['radii'])
+        self.assertGreaterEqual(stats.total, 1.)
+        self.assertEqual(stats.counts, {'iterations': 3})
+
+    def test_command_line_interface_logs_stages(self):
+        """
+        Given the DEBUG verbosity, the CLI should log the stages of the alpha
+        shape.
+        """
+        gdf = geopandas.GeoDataFrame(geometry=geopandas.points_from_xy(
+            self.points[:, 0], self.points[:, 1]), crs='EPSG:4326')
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, 'points.geojson')
+            gdf.to_file(source, driver='GeoJSON')
+            result = CliRunner().invoke(cli.main, [
+                source, os.path.join(directory, 'shape.geojson'),
+                '--alpha', '5', '-v', 'DEBUG'])
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn('Stage triangulation', result.output)
+        self.assertIn('Count facets', result.output)
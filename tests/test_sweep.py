@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for `alphashape_sweep` function."""
+
+
+import unittest
+from unittest import mock
+
+import numpy as np
+import geopandas
+from scipy.spatial import Delaunay
+from alphashape import alphashape, alphashape_sweep
+
+
+class TestAlphashapeSweep(unittest.TestCase):
+    """Tests for `alphashape_sweep` function."""
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+        self.points = np.random.RandomState(0).random_sample((400, 2))
+        self.alphas = [4., 0., 12., 1., 8.]
+
+    def tearDown(self):
+        """Tear down test fixtures, if any."""
+
+    def test_levels_match_alphashape(self):
+        """
+        Given alpha values in any order, every level should match the alpha
+        shape of that alpha value, and the points should be triangulated
+        once.
+        """
+        with mock.patch('alphashape.alphacomplex.Delaunay',
+                        wraps=Delaunay) as patched:
+            results = alphashape_sweep(self.points, self.alphas)
+        self.assertEqual(patched.call_count, 1)
+        self.assertEqual(len(results), len(self.alphas))
+        for alpha, result in zip(self.alphas, results):
+            self.assertTrue(result.equals(alphashape(self.points, alpha)))
+
+    def test_levels_are_nested(self):
+        """
+        Given increasing alpha values, the shapes should be nested.
+        """
+        results = alphashape_sweep(self.points, sorted(self.alphas))
+        for larger, smaller in zip(results, results[1:]):
+            self.assertTrue(larger.buffer(1e-9).contains(smaller))
+
+    def test_three_dimensional_levels(self):
+        """
+        Given three dimensional points, every level should be the mesh of
+        that alpha value.
+        """
+        points = np.random.RandomState(1).random_sample((150, 3))
+        results = alphashape_sweep(points, [1., 3.])
+        for alpha, result in zip([1., 3.], results):
+            expected = alphashape(points, alpha)
+            np.testing.assert_array_equal(result.vertices, expected.vertices)
+            np.testing.assert_array_equal(
+                np.sort(result.faces, axis=1), np.sort(expected.faces, axis=1))
+
+    def test_given_a_geodataframe_return_a_geodataframe(self):
+        """
+        Given a GeoDataFrame, the levels should be the rows of a GeoDataFrame
+        with the alpha values and the coordinate reference system.
+        """
+        gdf = geopandas.GeoDataFrame(geometry=geopandas.points_from_xy(
+            self.points[:, 0], self.points[:, 1]), crs='EPSG:32633')
+        results = alphashape_sweep(gdf, self.alphas)
+        self.assertEqual(results.crs, gdf.crs)
+        self.assertEqual(list(results['alpha']), self.alphas)
+        self.assertTrue(results.geometry[2].equals(
+            alphashape(self.points, 12.)))
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for tiled alpha shapes."""
+
+
+import unittest
+
+import numpy as np
+from alphashape import alphashape
+from alphashape.tiling import tiled_simplices
+
+
+class TestTiling(unittest.TestCase):
+    """Tests for tiled alpha shapes."""
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+        self.points = np.random.RandomState(0).random_sample((5000, 2))
+
+    def tearDown(self):
+        """Tear down test fixtures, if any."""
+
+    def test_tiled_alphashape_matches_monolithic_2d(self):
+        """
+        Given random points, the tiled alpha shape should match the alpha
+        shape of the whole point set for any number of tiles.
+        """
+        expected = alphashape(self.points, 20.)
+        for tiles in (1, 3, (2, 5)):
+            result = alphashape(self.points, 20., tiles=tiles, processes=1)
+            self.assertTrue(result.equals(expected))
+
+    def test_tiled_alphashape_matches_monolithic_3d(self):
+        """
+        Given random 3-dimensional points and a process pool, the tiled
+        surface should have the same faces as the monolithic one.
+        """
+        points = np.random.RandomState(1).random_sample((1000, 3))
+        expected = alphashape(points, 4.)
+        result = alphashape(points, 4., tiles=2, processes=2)
+        self.assertEqual(
+            set(map(frozenset, expected.faces.tolist())),
+            set(map(frozenset, result.faces.tolist())))
+
+    def test_every_simplex_is_owned_by_one_tile(self):
+        """
+        Given many small tiles, no accepted simplex should be reported twice.
+        """
+        simplices = tiled_simplices(self.points, 20., 6, processes=1)
+        self.assertEqual(len(np.unique(np.sort(simplices, axis=1), axis=0)),
+                         len(simplices))
+
+    def test_tiled_alphashape_requires_a_constant_alpha(self):
+        """
+        Given no alpha value or a callable one, tiling should be refused.
+        """
+        with self.assertRaises(ValueError):
+            alphashape(self.points, tiles=2)
+        with self.assertRaises(ValueError):
+            alphashape(self.points, lambda a, b: 20., tiles=2)